@@ -5,8 +5,11 @@ Ce CLI simplifié utilise un fichier de configuration YAML unique pour tous les
 """
 from __future__ import annotations
 
+import multiprocessing
+import selectors
 import sys
 from pathlib import Path
+from typing import List
 
 import click
 
@@ -64,7 +67,7 @@ def cli():
 @cli.command()
 @click.option(
     '--config',
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    type=Path,
     default='devtools_config.yaml',
     help='Chemin vers le fichier de configuration YAML (défaut: devtools_config.yaml)'
 )
@@ -76,8 +79,8 @@ def cli():
 )
 @click.option(
     '--debug/--no-debug',
-    default=True,
-    help='Activer le mode debug (défaut: activé)'
+    default=False,
+    help='Activer le mode debug : rechargement automatique et débogueur Flask (défaut: désactivé)'
 )
 def event_flow(config: Path, host: str, debug: bool):
     """
@@ -103,7 +106,7 @@ def event_flow(config: Path, host: str, debug: bool):
 @cli.command()
 @click.option(
     '--config',
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    type=Path,
     default='devtools_config.yaml',
     help='Chemin vers le fichier de configuration YAML (défaut: devtools_config.yaml)'
 )
@@ -115,8 +118,8 @@ def event_flow(config: Path, host: str, debug: bool):
 )
 @click.option(
     '--debug/--no-debug',
-    default=True,
-    help='Activer le mode debug (défaut: activé)'
+    default=False,
+    help='Activer le mode debug : rechargement automatique et débogueur Flask (défaut: désactivé)'
 )
 def event_recorder(config: Path, host: str, debug: bool):
     """
@@ -142,7 +145,7 @@ def event_recorder(config: Path, host: str, debug: bool):
 @cli.command()
 @click.option(
     '--config',
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    type=Path,
     default='devtools_config.yaml',
     help='Chemin vers le fichier de configuration YAML (défaut: devtools_config.yaml)'
 )
@@ -181,7 +184,7 @@ def mock_exchange(config: Path, host: str):
 @cli.command()
 @click.option(
     '--config',
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    type=Path,
     default='devtools_config.yaml',
     help='Chemin vers le fichier de configuration YAML (défaut: devtools_config.yaml)'
 )
@@ -221,7 +224,7 @@ def scenario_testing(config: Path, host: str):
 @cli.command()
 @click.option(
     '--config',
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    type=Path,
     default='devtools_config.yaml',
     help='Chemin vers le fichier de configuration YAML (défaut: devtools_config.yaml)'
 )
@@ -231,7 +234,6 @@ def serve_all(config: Path):
 
     Démarre Event Flow, Event Recorder, Mock Exchange et Scenario Testing en parallèle.
     """
-    import multiprocessing
     from python_pubsub_devtools.service_bus import ServiceBus
     from python_pubsub_devtools.event_flow.server import EventFlowServer
     from python_pubsub_devtools.event_recorder.server import EventRecorderServer
@@ -282,31 +284,75 @@ def serve_all(config: Path):
     # Créer les processus pour chaque service
     processes = []
 
-    processes.append(multiprocessing.Process(target=run_event_flow))
-    processes.append(multiprocessing.Process(target=run_event_recorder))
-    processes.append(multiprocessing.Process(target=run_mock_exchange))
+    processes.append(multiprocessing.Process(target=run_event_flow, name='event_flow'))
+    processes.append(multiprocessing.Process(target=run_event_recorder, name='event_recorder'))
+    processes.append(multiprocessing.Process(target=run_mock_exchange, name='mock_exchange'))
     if cfg.scenario_testing:
-        processes.append(multiprocessing.Process(target=run_scenario_testing))
+        processes.append(
+            multiprocessing.Process(target=run_scenario_testing, name='scenario_testing'))
 
     try:
         # Démarrer tous les processus
         for p in processes:
             p.start()
 
-        # Attendre tous les processus
-        for p in processes:
-            p.join()
+        # Surveiller tous les processus en une seule boucle : les services sont des serveurs
+        # permanents, toute sortie (même avec le code 0) est inattendue et arrête les autres
+        stopped = _supervise_processes(processes)
+        if stopped is not None:
+            click.echo(f"❌ Le service {stopped.name} s'est arrêté (code {stopped.exitcode}), "
+                       f"arrêt des autres services...", err=True)
+            _terminate_processes(processes)
+            sys.exit(1)
 
     except KeyboardInterrupt:
         click.echo("\n👋 Arrêt de tous les services...")
-        for p in processes:
-            if p.is_alive():
-                p.terminate()
-                p.join(timeout=5)
+        _terminate_processes(processes)
         click.echo("✅ Tous les services sont arrêtés")
         sys.exit(0)
 
 
+def _supervise_processes(
+        processes: List[multiprocessing.Process]) -> multiprocessing.Process | None:
+    """Attend la première sortie d'un des processus, quel que soit son code de sortie.
+
+    Les sentinelles des processus sont surveillées via un sélecteur unique : la sortie
+    de n'importe quel enfant est détectée immédiatement, au lieu d'attendre le join()
+    séquentiel des processus précédents. Un Ctrl+C interrompt select() directement.
+
+    Args:
+        processes: Processus multiprocessing déjà démarrés
+
+    Returns:
+        Le premier processus terminé (code de sortie nul ou non), ou None si la
+        liste est vide
+    """
+    with selectors.DefaultSelector() as selector:
+        for process in processes:
+            selector.register(process.sentinel, selectors.EVENT_READ, process)
+
+        while selector.get_map():
+            for key, _ in selector.select(timeout=1.0):
+                process = key.data
+                process.join()
+                return process
+    return None
+
+
+def _terminate_processes(processes: List[multiprocessing.Process], timeout: float = 5.0) -> None:
+    """Envoie SIGTERM à tous les processus encore actifs puis attend leur fin.
+
+    Args:
+        processes: Processus multiprocessing à arrêter
+        timeout: Délai maximal d'attente par processus, en secondes
+    """
+    alive = [p for p in processes if p.is_alive()]
+    for p in alive:
+        p.terminate()
+    for p in alive:
+        p.join(timeout=timeout)
+
+
 @cli.command()
 @click.option(
     '--output',
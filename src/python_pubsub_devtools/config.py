@@ -218,11 +218,13 @@ class DevToolsConfig(BaseModel):
         """
         config_path = Path(filepath).resolve()
 
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-        with open(config_path, 'r') as f:
-            data = yaml.safe_load(f)
+        # L'ouverture sert de test d'existence : pas d'exists() préalable
+        # (resolve() reste nécessaire pour suivre un éventuel lien symbolique)
+        try:
+            with open(config_path, 'r') as f:
+                data = yaml.safe_load(f)
+        except (FileNotFoundError, IsADirectoryError):
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
 
         # Résoudre les chemins relatifs par rapport au fichier de config
         config_dir = config_path.parent
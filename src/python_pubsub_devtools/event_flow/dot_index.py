@@ -0,0 +1,75 @@
+"""
+DOT Index - Pre-parsed view of an event flow graph
+
+Splits the DOT sent by the scanner into header lines, node definitions and edges
+once, so that filtering a graph no longer re-parses its text on every request.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Tuple
+
+# DOT parsing patterns, compiled once at import time
+_HEADER_PREFIX = ('digraph', 'graph', 'rankdir', 'node', 'edge')
+_ATTR_RE = re.compile(r'\[(.*?)\]')
+_NS_CLASS_RE = re.compile(r'class="namespace-([^"]+)"')
+_EDGE_RE = re.compile(r'"([^"]+)"\s*->\s*"([^"]+)"')
+
+
+@dataclass
+class DotIndex:
+    """Lines of a DOT graph, grouped and keyed for filtering"""
+
+    header_lines: List[str] = field(default_factory=list)
+    # node name -> definition line (the last definition of a node wins)
+    node_lines: Dict[str, str] = field(default_factory=dict)
+    # node name -> namespace, for nodes carrying a class="namespace-xxx" attribute
+    node_namespaces: Dict[str, str] = field(default_factory=dict)
+    # (source, target, attributes) -> edge line; identical repeated edges are kept once,
+    # parallel edges with different attributes (e.g. labels) are all kept
+    edges: Dict[Tuple[str, str, str], str] = field(default_factory=dict)
+    # every namespace carried by at least one node
+    namespaces: FrozenSet[str] = frozenset()
+
+
+def parse_dot(dot_content: str) -> DotIndex:
+    """
+    Parse DOT content in a single pass.
+
+    Args:
+        dot_content: DOT text as produced by the scanner
+
+    Returns:
+        The DotIndex of the graph
+    """
+    index = DotIndex()
+
+    for line in dot_content.splitlines():
+        stripped_line = line.strip()
+        if stripped_line.startswith(_HEADER_PREFIX):
+            index.header_lines.append(line)
+        elif '->' in stripped_line:
+            match = _EDGE_RE.search(stripped_line)
+            if match:
+                attr_match = _ATTR_RE.search(stripped_line, match.end())
+                attributes = attr_match.group(1).strip() if attr_match else ''
+                index.edges.setdefault((*match.groups(), attributes), stripped_line)
+        elif '[' in stripped_line and ']' in stripped_line:
+            # The node name is the first quoted string: plain slicing avoids a regex call per line
+            start = stripped_line.find('"')
+            end = stripped_line.find('"', start + 1) if start >= 0 else -1
+            if end <= start + 1:
+                continue
+            node_name = stripped_line[start + 1:end]
+            index.node_lines[node_name] = line
+            index.node_namespaces.pop(node_name, None)
+
+            # The namespace is stored as class="namespace-xxx" on every node (agents and events)
+            attr_match = _ATTR_RE.search(line)
+            class_match = _NS_CLASS_RE.search(attr_match.group(1)) if attr_match else None
+            if class_match:
+                index.node_namespaces[node_name] = class_match.group(1)
+
+    index.namespaces = frozenset(index.node_namespaces.values())
+    return index
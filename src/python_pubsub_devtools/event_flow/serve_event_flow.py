@@ -9,14 +9,85 @@ Usage:
 """
 from __future__ import annotations
 
+import html
+import json
+import os
 import re
 import subprocess
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Callable, Collection, Iterable
 
 from flask import Flask, render_template, request, jsonify, Response
+from flask.json.provider import DefaultJSONProvider
 
-# Import storage
-from .storage import get_storage, initialize_storage, GraphData
+try:
+    import orjson
+except ImportError:  # orjson est optionnel (extra "fast") : repli sur le module json standard
+    orjson = None
+
+try:
+    from whitenoise import WhiteNoise
+except ImportError:  # whitenoise est optionnel (extra "server") : Flask sert les fichiers statiques
+    WhiteNoise = None
+
+# Import storage and DOT index
+from .dot_index import DotIndex
+from .storage import GRAPH_STAT_KEYS, get_storage, initialize_storage, is_valid_stats, GraphData
+
+
+# Cache LRU des SVG filtrés : un filtre déjà demandé (bascule d'un namespace dans l'UI,
+# plusieurs clients sur la même vue) ne repasse ni par le filtrage ni par Graphviz.
+# La clé contient l'empreinte du DOT : un graphe re-stocké n'atteint plus les anciennes entrées.
+_FILTERED_SVG_CACHE_SIZE = 128
+_filtered_svg_cache: OrderedDict[tuple, bytes] = OrderedDict()
+_filtered_svg_cache_lock = threading.Lock()
+
+# Pool des conversions Graphviz : autant de `dot` simultanés que de cœurs, quel que soit
+# le nombre de requêtes en cours. Des threads suffisent, le travail se fait dans `dot`.
+_CONVERSION_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                          thread_name_prefix='dot-convert')
+
+# Conversions en cours, par clé : les requêtes simultanées pour un même rendu
+# partagent un seul `dot`
+_pending_conversions: dict[tuple, Future] = {}
+_pending_conversions_lock = threading.Lock()
+
+# La route /graph attend le rendu au plus RENDER_WAIT_SECONDS, puis répond 202 :
+# le client réessaie après RENDER_RETRY_AFTER_SECONDS et récupère le rendu en cours
+RENDER_WAIT_SECONDS = 5
+RENDER_RETRY_AFTER_SECONDS = 2
+
+# Nombre maximal de filtres par requête /api/graph/filtered_batch : un lot est rendu par un
+# seul `dot` qui occupe un worker du pool, sa taille doit donc rester bornée
+MAX_FILTERS_PER_BATCH = 16
+
+# Taille maximale d'un corps de requête une fois décompressé : au-delà, un petit envoi gzip
+# pourrait se dilater en plusieurs gigaoctets en mémoire
+MAX_DECOMPRESSED_BODY_BYTES = 256 * 1024 * 1024
+
+
+# SVG renvoyé pour un filtre qui ne retient aucun nœud
+EMPTY_SVG = b'<svg xmlns="http://www.w3.org/2000/svg" width="0pt" height="0pt" viewBox="0 0 0 0"/>'
+
+# SVG d'erreur, encodés une fois pour toutes (le nom du graphe est inséré par formatage %)
+ERROR_SVG_CONVERSION_FAILED = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" width="400" height="40">'
+    b'<text x="10" y="25" fill="#c62828">SVG Conversion Failed.</text></svg>'
+)
+ERROR_SVG_NOT_FOUND_TEMPLATE = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" width="400" height="40">'
+    b'<text x="10" y="25" fill="#c62828">Graph \'%s\' not found.</text></svg>'
+)
+
+
+# Début de chaque document produit par `dot -Tsvg` (sert à découper une sortie multi-graphes)
+SVG_XML_DECLARATION_PREFIX = b'<?xml'
 
 
 # Namespace colors (used for UI display) - could be moved to config
@@ -45,86 +116,523 @@ from .storage import get_storage, initialize_storage, GraphData
 def _convert_dot_to_svg(dot_content: str, graph_type: str) -> bytes | None:
     """
     Convert DOT content to SVG using Graphviz
+
+    Le DOT est transmis sur l'entrée standard de `dot` et le SVG lu sur sa sortie :
+    aucun fichier temporaire, et deux conversions simultanées d'un même graph_type
+    ne peuvent plus s'écraser mutuellement.
     """
-    import tempfile
+    try:
+        result = subprocess.run(
+            ['dot', '-Tsvg'],
+            input=dot_content.encode('utf-8'), check=True, capture_output=True, timeout=30
+        )
+        return result.stdout
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, Exception) as e:
+        print(f"Error converting DOT to SVG ({graph_type}): {e}")
+        return None
+
 
-    temp_dir = Path(tempfile.gettempdir())
-    dot_file = temp_dir / f"cached_{graph_type}.dot"
-    svg_file = temp_dir / f"cached_{graph_type}.svg"
+def _convert_many_dot_to_svg(dot_contents: list[str], graph_type: str) -> list[bytes] | None:
+    """
+    Convertit plusieurs graphes DOT en SVG avec un seul processus `dot`.
 
+    `dot` accepte plusieurs graphes à la suite sur son entrée standard et écrit un
+    document SVG complet par graphe, chacun commençant par sa déclaration XML.
+
+    Returns:
+        Les SVG dans l'ordre des graphes, ou None si la conversion échoue.
+    """
     try:
-        dot_file.write_text(dot_content, encoding='utf-8')
-        subprocess.run(
-            ['dot', '-Tsvg', str(dot_file), '-o', str(svg_file)],
-            check=True, capture_output=True, text=True, timeout=30
+        result = subprocess.run(
+            ['dot', '-Tsvg'],
+            input='\n'.join(dot_contents).encode('utf-8'),
+            check=True, capture_output=True, timeout=30
         )
-        return svg_file.read_bytes()
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired, Exception) as e:
-        print(f"Error converting DOT to SVG: {e}")
+        print(f"Error converting DOT to SVG ({graph_type}, batch of {len(dot_contents)}): {e}")
+        return None
+
+    svgs = [SVG_XML_DECLARATION_PREFIX + part
+            for part in result.stdout.split(SVG_XML_DECLARATION_PREFIX) if part.strip()]
+    if len(svgs) != len(dot_contents):
+        print(f"Error converting DOT to SVG ({graph_type}): "
+              f"expected {len(dot_contents)} documents, got {len(svgs)}")
+        return None
+    return svgs
+
+
+def _forget_pending_conversion(key: tuple, future: Future) -> None:
+    """Retire une conversion terminée de la table des conversions en cours."""
+    with _pending_conversions_lock:
+        if _pending_conversions.get(key) is future:
+            del _pending_conversions[key]
+
+
+def _submit_conversion_once(key: tuple, fn: Callable, *args) -> Future:
+    """
+    Soumet une conversion au pool, sauf si une conversion de même clé est déjà en cours.
+
+    Returns:
+        Le Future de la conversion, partagé par tous les demandeurs jusqu'à sa fin.
+    """
+    with _pending_conversions_lock:
+        future = _pending_conversions.get(key)
+        if future is not None:
+            return future
+        future = _CONVERSION_EXECUTOR.submit(fn, *args)
+        _pending_conversions[key] = future
+    future.add_done_callback(partial(_forget_pending_conversion, key))
+    return future
+
+
+def _reachable_nodes(nodes: Collection[str], edges: Iterable[tuple[str, str]], roots: list[str],
+                     max_depth: int | None) -> set[str]:
+    """
+    Restreint un ensemble de nœuds à ceux atteignables depuis des racines (parcours en largeur).
+
+    Args:
+        nodes: Nœuds candidats
+        edges: Arêtes (source, cible) du graphe
+        roots: Nœuds de départ (ignorés s'ils ne sont pas candidats)
+        max_depth: Nombre maximal d'arêtes parcourues depuis une racine (None = illimité)
+
+    Returns:
+        Les nœuds candidats atteignables
+    """
+    successors: dict[str, list[str]] = {}
+    for source, target in edges:
+        if source in nodes and target in nodes:
+            successors.setdefault(source, []).append(target)
+
+    reached = {root for root in roots if root in nodes}
+    frontier = list(reached)
+    depth = 0
+    while frontier and (max_depth is None or depth < max_depth):
+        next_frontier = []
+        for node in frontier:
+            for target in successors.get(node, ()):
+                if target not in reached:
+                    reached.add(target)
+                    next_frontier.append(target)
+        frontier = next_frontier
+        depth += 1
+    return reached
+
+
+def _filter_dot_content(dot_index: DotIndex, namespaces: Iterable[str], keywords: list[str],
+                        roots: list[str] | None = None, max_depth: int | None = None) -> str:
+    """
+    Filtre un graphe pré-analysé en ne gardant que les nœuds et arêtes pertinents.
+
+    Le DOT a été découpé une fois pour toutes (voir GraphData.dot_index) : le filtrage
+    se réduit à des recherches dans des dictionnaires, sans regex sur le texte du graphe.
+
+    Si des racines sont fournies, seul le sous-graphe atteignable depuis elles (à au plus
+    max_depth arêtes) est conservé : sur les gros graphes, cela réduit fortement le
+    travail de layout de Graphviz.
+    """
+    ns_set = frozenset(namespaces)  # Appartenance en O(1) pour chaque nœud
+    # Une seule alternance insensible à la casse teste tous les mots-clés en un passage
+    keywords_re = (re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+                   if keywords else None)
+
+    # 1. Sélectionner les nœuds (agents + événements) dont le namespace est coché,
+    # 2. en excluant ceux qui correspondent aux mots-clés.
+    #    Un dict garde l'ordre du DOT d'origine : pas besoin de trier pour un rendu stable.
+    final_nodes_to_keep = dict.fromkeys(
+        node_name for node_name, node_namespace in dot_index.node_namespaces.items()
+        if node_namespace in ns_set and not (keywords_re and keywords_re.search(node_name))
+    )
+
+    # 3. Restreindre au sous-graphe atteignable depuis les racines demandées
+    if roots:
+        edges = ((source, target) for source, target, _ in dot_index.edges)
+        reachable = _reachable_nodes(final_nodes_to_keep, edges, roots, max_depth)
+        final_nodes_to_keep = dict.fromkeys(
+            name for name in final_nodes_to_keep if name in reachable)
+
+    # 4. Reconstruire le graphe dans une seule liste
+    #    (les arêtes répétées ont déjà été fusionnées à l'analyse)
+    output = list(dot_index.header_lines)
+    output.extend(dot_index.node_lines[name] for name in final_nodes_to_keep)
+    output.extend(
+        line for (source, target, _), line in dot_index.edges.items()
+        if source in final_nodes_to_keep and target in final_nodes_to_keep
+    )
+    output.append("}")
+    return "\n".join(output)
+
+
+def _get_cached_svg(cache_key: tuple) -> bytes | None:
+    """Lit un SVG dans le cache LRU (et le marque comme récemment utilisé)."""
+    with _filtered_svg_cache_lock:
+        svg_content = _filtered_svg_cache.get(cache_key)
+        if svg_content is not None:
+            _filtered_svg_cache.move_to_end(cache_key)
+        return svg_content
+
+
+def _put_cached_svg(cache_key: tuple, svg_content: bytes) -> None:
+    """Ajoute un SVG au cache LRU en évinçant les entrées les plus anciennes."""
+    with _filtered_svg_cache_lock:
+        _filtered_svg_cache[cache_key] = svg_content
+        _filtered_svg_cache.move_to_end(cache_key)
+        while len(_filtered_svg_cache) > _FILTERED_SVG_CACHE_SIZE:
+            _filtered_svg_cache.popitem(last=False)
+
+
+def _full_svg_future(graph_data: GraphData) -> Future:
+    """Lance (ou rejoint) le rendu complet d'un graphe dans le pool de conversion."""
+    return _submit_conversion_once(('full', graph_data.graph_type, graph_data.digest),
+                                   graph_data.render_svg, _convert_dot_to_svg)
+
+
+def _render_full_svg(graph_data: GraphData) -> bytes | None:
+    """
+    Rend le graphe complet, sans filtrage.
+
+    Le SVG fourni par le scanner est utilisé tel quel ; à défaut, le DOT est converti
+    une seule fois et le résultat reste attaché au GraphData (voir GraphData.render_svg).
+
+    Returns:
+        Le SVG, ou None si la conversion échoue.
+    """
+    svg_content = graph_data.rendered_svg
+    if svg_content is None:
+        svg_content = _full_svg_future(graph_data).result()
+    return svg_content
+
+
+def _is_string_list(value) -> bool:
+    """Vérifie qu'une valeur JSON est une liste de chaînes."""
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+@dataclass(frozen=True)
+class _GraphFilter:
+    """Filtre demandé par l'UI pour un graphe (namespaces cochés, mots-clés exclus, racines)"""
+
+    namespaces: frozenset[str]
+    keywords: tuple[str, ...] = ()
+    roots: tuple[str, ...] = ()
+    max_depth: int | None = None
+
+    @classmethod
+    def from_dict(cls, filters: dict) -> _GraphFilter:
+        """
+        Construit un filtre à partir du JSON reçu.
+
+        Raises:
+            ValueError: Si le filtre est invalide
+        """
+        if not isinstance(filters, dict):
+            raise ValueError('filters must be a JSON object')
+        for name in ('namespaces', 'keywords', 'roots'):
+            if not _is_string_list(filters.get(name, [])):
+                raise ValueError(f'{name} must be a list of strings')
+        max_depth = filters.get('depth')
+        # bool est une sous-classe d'int : `true` n'est pas une profondeur
+        if max_depth is not None and (not isinstance(max_depth, int) or isinstance(max_depth, bool)
+                                      or max_depth < 0):
+            raise ValueError('depth must be a non-negative integer')
+        return cls(
+            namespaces=frozenset(filters.get('namespaces', [])),
+            keywords=tuple(filters.get('keywords', [])),
+            roots=tuple(filters.get('roots', [])),
+            max_depth=max_depth,
+        )
+
+    def cache_key(self, graph_data: GraphData) -> tuple:
+        """Clé du cache de SVG, indépendante de l'ordre des listes et de la casse des mots-clés."""
+        return (graph_data.graph_type, graph_data.digest, tuple(sorted(self.namespaces)),
+                tuple(sorted(k.lower() for k in self.keywords)), tuple(sorted(self.roots)),
+                self.max_depth)
+
+    def filter_dot(self, graph_data: GraphData) -> str:
+        """Applique le filtre au DOT pré-analysé du graphe."""
+        return _filter_dot_content(graph_data.dot_index, self.namespaces, list(self.keywords),
+                                   list(self.roots), self.max_depth)
+
+
+def _resolve_filtered_svg(graph_data: GraphData, graph_filter: _GraphFilter) -> bytes | None:
+    """
+    Résout un filtre sans passer par le filtrage quand c'est possible.
+
+    Returns:
+        Un SVG vide si aucun namespace demandé n'existe dans le graphe, le graphe complet
+        pour un filtre qui retient tout, le SVG filtré s'il est déjà en cache ; sinon None.
+    """
+    # Aucun namespace demandé n'existe dans le graphe : le résultat est vide,
+    # inutile de filtrer ni de lancer Graphviz
+    if graph_filter.namespaces.isdisjoint(graph_data.dot_index.namespaces):
+        return EMPTY_SVG
+
+    # Sans filtre effectif, le graphe complet suffit : aucun mot-clé ni racine, tous les namespaces
+    # présents dans le DOT cochés (pas seulement ceux déclarés par le scanner) et aucun nœud sans
+    # namespace, que le filtrage aurait écarté
+    dot_index = graph_data.dot_index
+    if (not graph_filter.keywords and not graph_filter.roots
+            and graph_filter.namespaces >= dot_index.namespaces
+            and len(dot_index.node_namespaces) == len(dot_index.node_lines)):
+        return _render_full_svg(graph_data)
+
+    return _get_cached_svg(graph_filter.cache_key(graph_data))
+
+
+def _convert_filtered_svg(graph_data: GraphData, graph_filter: _GraphFilter) -> bytes | None:
+    """Filtre et convertit un graphe (dans le pool de conversion), puis met le SVG en cache."""
+    svg_content = _convert_dot_to_svg(graph_filter.filter_dot(graph_data),
+                                      f"{graph_data.graph_type}_filtered")
+    if svg_content is not None:
+        _put_cached_svg(graph_filter.cache_key(graph_data), svg_content)
+    return svg_content
+
+
+def _render_filtered_svg(graph_data: GraphData, graph_filter: _GraphFilter) -> bytes | None:
+    """
+    Filtre un graphe puis le convertit en SVG, en passant par le cache LRU des SVG filtrés.
+
+    Returns:
+        Le SVG, ou None si la conversion échoue (les échecs ne sont pas mis en cache).
+    """
+    svg_content = _resolve_filtered_svg(graph_data, graph_filter)
+    if svg_content is not None:
+        return svg_content
+
+    # Les requêtes simultanées pour un même filtre attendent la même conversion
+    future = _submit_conversion_once(graph_filter.cache_key(graph_data), _convert_filtered_svg,
+                                     graph_data, graph_filter)
+    return future.result()
+
+
+def _render_filtered_svgs(graph_data: GraphData,
+                          graph_filters: list[_GraphFilter]) -> list[bytes] | None:
+    """
+    Rend plusieurs filtres d'un même graphe.
+
+    Les SVG absents du cache sont produits par un seul appel à `dot`.
+
+    Returns:
+        Les SVG dans l'ordre des filtres, ou None si la conversion échoue.
+    """
+    svgs = [_resolve_filtered_svg(graph_data, graph_filter) for graph_filter in graph_filters]
+    missing = [position for position, svg_content in enumerate(svgs) if svg_content is None]
+    if not missing:
+        return svgs
+
+    converted = _CONVERSION_EXECUTOR.submit(
+        _convert_many_dot_to_svg,
+        [graph_filters[position].filter_dot(graph_data) for position in missing],
+        f"{graph_data.graph_type}_filtered"
+    ).result()
+    if converted is None:
+        return None
+
+    for position, svg_content in zip(missing, converted):
+        _put_cached_svg(graph_filters[position].cache_key(graph_data), svg_content)
+        svgs[position] = svg_content
+    return svgs
+
+
+# Types MIME acceptés pour un envoi de DOT brut (hors JSON)
+DOT_MIMETYPES = frozenset({'text/vnd.graphviz', 'application/vnd.graphviz'})
+
+
+def _read_request_body() -> bytes | None:
+    """
+    Lit le corps brut de la requête, en le décompressant s'il est envoyé en gzip.
+
+    Le scanner peut envoyer `Content-Encoding: gzip` : le DOT de gros graphes se
+    compresse très bien, ce qui réduit d'autant le volume transféré.
+
+    La décompression est bornée à MAX_DECOMPRESSED_BODY_BYTES pour qu'un corps
+    malveillant ne puisse pas épuiser la mémoire du serveur.
+
+    Returns:
+        Le corps décompressé, ou None si la décompression échoue ou dépasse la limite.
+    """
+    body = request.get_data()
+    if request.content_encoding != 'gzip':
+        return body
+
+    try:
+        return _gunzip_bounded(body, MAX_DECOMPRESSED_BODY_BYTES)
+    except zlib.error:
+        return None
+
+
+def _gunzip_bounded(data: bytes, limit: int) -> bytes | None:
+    """
+    Décompresse des données gzip (éventuellement multi-membres) sans dépasser `limit` octets.
+
+    Returns:
+        Les données décompressées, ou None si elles sont tronquées ou dépassent la limite.
+    """
+    chunks = []
+    size = 0
+    while data:
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        # Un octet de plus que le reste autorisé suffit à détecter le dépassement
+        chunk = decompressor.decompress(data, limit - size + 1)
+        size += len(chunk)
+        if size > limit or not decompressor.eof:
+            return None
+        chunks.append(chunk)
+        data = decompressor.unused_data
+    return b''.join(chunks)
+
+
+def _read_json_payload() -> dict | None:
+    """
+    Lit le corps JSON de la requête, éventuellement compressé en gzip.
+
+    Returns:
+        Le payload décodé, ou None si le corps est absent ou invalide.
+    """
+    body = _read_request_body()
+    if not body:
+        return None
+
+    try:
+        return orjson.loads(body) if orjson is not None else json.loads(body)
+    except ValueError:  # orjson.JSONDecodeError hérite de ValueError
+        return None
+
+
+def _read_raw_dot_payload() -> dict | None:
+    """
+    Construit le payload d'un graphe envoyé en DOT brut.
+
+    Le corps contient directement le DOT (éventuellement transmis en chunked et/ou
+    gzip) ; les métadonnées passent en paramètres de requête : `graph_type`,
+    `namespaces` (séparés par des virgules) et les statistiques `events`, `agents`,
+    `connections`. Le scanner évite ainsi de sérialiser le DOT dans un document JSON.
+
+    Returns:
+        Un payload de même forme que le JSON de /api/graph, ou None si invalide.
+    """
+    body = _read_request_body()
+    graph_type = request.args.get('graph_type')
+    if body is None or not graph_type:
+        return None
+
+    try:
+        dot_content = body.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+
+    # Une statistique non entière est rejetée, comme dans le JSON (pas de repli silencieux sur 0)
+    stats = {}
+    for key in GRAPH_STAT_KEYS:
+        if key in request.args:
+            try:
+                stats[key] = int(request.args[key])
+            except ValueError:
+                return None
+
+    namespaces = request.args.get('namespaces', '')
+    return {
+        'graph_type': graph_type,
+        'dot_content': dot_content,
+        'namespaces': [ns for ns in namespaces.split(',') if ns],
+        'stats': stats,
+    }
+
+
+def _graph_data_from_payload(data: dict,
+                             default_namespaces: list[str] | None = None) -> GraphData | None:
+    """
+    Valide un graphe reçu par l'API et construit le GraphData correspondant.
+
+    Chaque champ n'est lu qu'une fois : la validation et la construction se font
+    dans la même passe.
+
+    Args:
+        data: Graphe reçu (graph_type et dot_content obligatoires)
+        default_namespaces: Namespaces utilisés si le graphe n'en précise pas
+
+    Returns:
+        Le GraphData correspondant, ou None si un champ obligatoire manque ou est mal typé
+        (namespaces hors liste de chaînes, stats hors dictionnaire d'entiers)
+    """
+    graph_type = data.get('graph_type')
+    dot_content = data.get('dot_content')
+    if not isinstance(graph_type, str) or not graph_type or not isinstance(dot_content, str):
+        return None
+
+    svg_content = data.get('svg_content')
+    namespaces = data.get('namespaces')
+    if namespaces is None:
+        namespaces = default_namespaces or []
+    stats = data.get('stats')
+    if stats is None:
+        stats = {}
+    if (svg_content is not None and not isinstance(svg_content, str)) \
+            or not _is_string_list(namespaces) or not is_valid_stats(stats):
         return None
-    finally:
-        if dot_file.exists(): dot_file.unlink()
-        if svg_file.exists(): svg_file.unlink()
-
-
-def _filter_dot_content(dot_content: str, namespaces: list[str], keywords: list[str]) -> str:
-    """
-    Filtre le contenu DOT en ne gardant que les nœuds et arêtes pertinents.
-    """
-    lines = dot_content.splitlines()
-    header_lines = []
-    node_definitions = {}
-    edge_lines = []
-
-    for line in lines:
-        stripped_line = line.strip()
-        if stripped_line.startswith(('digraph', 'graph', 'rankdir', 'node', 'edge')):
-            header_lines.append(line)
-        elif '->' in stripped_line:
-            edge_lines.append(stripped_line)
-        elif '[' in stripped_line and ']' in stripped_line:
-            match = re.search(r'"([^"]+)"', stripped_line)
-            if match:
-                node_definitions[match.group(1)] = line
-
-    # --- LOGIQUE DE FILTRAGE CORRIGÉE ---
-
-    # 1. Sélectionner les nœuds (agents + événements) dont le namespace est coché
-    initial_nodes_to_keep = set()
-    attr_pattern = re.compile(r'\[(.*?)\]')
-
-    for node_name, definition_line in node_definitions.items():
-        attr_match = attr_pattern.search(definition_line)
-        if not attr_match: continue
-        attributes = attr_match.group(1)
-
-        # Le namespace est stocké dans class="namespace-xxx" pour tous les nœuds (agents et événements)
-        class_match = re.search(r'class="namespace-([^"]+)"', attributes)
-        if class_match:
-            node_namespace = class_match.group(1)
-            if node_namespace in namespaces:
-                initial_nodes_to_keep.add(node_name)
-
-    # 2. Exclure les nœuds correspondant aux mots-clés
-    final_nodes_to_keep = set()
-    for node_name in initial_nodes_to_keep:
-        if any(keyword.lower() in node_name.lower() for keyword in keywords):
-            continue  # Exclure ce nœud
-        final_nodes_to_keep.add(node_name)
-
-    # 3. Reconstruire le graphe
-    filtered_node_definitions = [node_definitions[name] for name in sorted(final_nodes_to_keep) if name in node_definitions]
-
-    filtered_edge_definitions = []
-    edge_pattern = re.compile(r'"([^"]+)"\s*->\s*"([^"]+)"')
-    for line in edge_lines:
-        match = edge_pattern.search(line)
-        if not match: continue
-        source, target = match.groups()
-        if source in final_nodes_to_keep and target in final_nodes_to_keep:
-            filtered_edge_definitions.append(line)
-
-    return "\n".join(header_lines + filtered_node_definitions + filtered_edge_definitions + ["}"])
+
+    return GraphData(
+        graph_type=graph_type,
+        dot_content=dot_content,
+        svg_content=svg_content,
+        namespaces=set(namespaces),
+        stats=stats
+    )
+
+
+def _not_modified(etag: str) -> Response | None:
+    """
+    Renvoie un 304 si le client possède déjà la version courante (brute ou gzip) de la ressource.
+
+    Permet de répondre avant même de produire le corps (rendu SVG notamment).
+    """
+    for candidate in (etag, f'{etag}-gzip'):
+        if request.if_none_match.contains(candidate):
+            response = Response(status=304)
+            response.set_etag(candidate)
+            return response
+    return None
+
+
+def _conditional_response(payload: str | bytes, mimetype: str, etag: str,
+                          gzip_payload: Callable[[], bytes] | None = None) -> Response:
+    """
+    Construit une réponse avec ETag, en honorant If-None-Match.
+
+    Le navigateur revalide à chaque affichage (no-cache) : si le graphe n'a pas changé,
+    il reçoit un 304 sans corps au lieu de retélécharger un DOT ou un SVG de plusieurs Mo.
+
+    Args:
+        payload: Corps non compressé
+        mimetype: Type MIME de la réponse
+        etag: ETag de la version non compressée
+        gzip_payload: Fournit le corps déjà compressé (calculé une fois puis mis en cache),
+            envoyé avec `Content-Encoding: gzip` aux clients qui l'acceptent
+    """
+    if gzip_payload is not None and 'gzip' in request.accept_encodings:
+        response = Response(gzip_payload(), mimetype=mimetype)
+        response.content_encoding = 'gzip'
+        etag = f'{etag}-gzip'
+    else:
+        response = Response(payload, mimetype=mimetype)
+    if gzip_payload is not None:
+        response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Fournisseur JSON de Flask basé sur orjson : utilisé par jsonify() et request.get_json()."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        # Les options de mise en forme (indent, sort_keys) du fournisseur par défaut sont ignorées
+        return orjson.dumps(obj, default=self.default,
+                            option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 
 def create_app(config) -> Flask:
@@ -133,6 +641,16 @@ def create_app(config) -> Flask:
     app = Flask(__name__,
                 template_folder=str(web_dir / 'templates'),
                 static_folder=str(web_dir / 'static'))
+    # Les fichiers statiques (CSS/JS) sont réutilisés par le navigateur
+    # sans revalidation pendant 1 minute
+    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 60
+    if WhiteNoise is not None:
+        # WhiteNoise sert /static/ avant Flask (et les variantes .gz/.br précompressées
+        # si présentes) : les threads du serveur restent disponibles pour les rendus de graphes
+        app.wsgi_app = WhiteNoise(app.wsgi_app, root=app.static_folder, prefix=app.static_url_path,
+                                  max_age=app.config['SEND_FILE_MAX_AGE_DEFAULT'])
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
 
     with app.app_context():
         initialize_storage(config)
@@ -140,20 +658,47 @@ def create_app(config) -> Flask:
     @app.route('/api/graph', methods=['POST'])
     def api_store_graph():
         storage = get_storage()
-        data = request.get_json()
-        if not all(k in data for k in ['graph_type', 'dot_content']):
-            return jsonify({'error': 'Missing required fields'}), 400
-
-        graph_data = GraphData(
-            graph_type=data['graph_type'],
-            dot_content=data['dot_content'],
-            svg_content=data.get('svg_content'),
-            namespaces=set(data.get('namespaces', [])),
-            stats=data.get('stats', {})
-        )
-        storage.store(graph_data)
+        if request.mimetype in DOT_MIMETYPES:
+            data = _read_raw_dot_payload()
+        else:
+            data = _read_json_payload()
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Invalid payload'}), 400
+        graph_data = _graph_data_from_payload(data)
+        if graph_data is None:
+            return jsonify({'error': 'Missing or invalid fields'}), 400
+
+        if not storage.store(graph_data):
+            return jsonify({'status': 'unchanged'}), 200
         return jsonify({'status': 'success'}), 201
 
+    @app.route('/api/graph/bulk', methods=['POST'])
+    def api_store_graphs_bulk():
+        """Stocke plusieurs graphes en une seule requête (une seule écriture disque)."""
+        storage = get_storage()
+        data = _read_json_payload()
+        if not isinstance(data, dict) or not isinstance(data.get('graphs'), list):
+            return jsonify({'error': 'Invalid JSON payload'}), 400
+        default_namespaces = data.get('namespaces', [])
+        if not _is_string_list(default_namespaces):
+            return jsonify({'error': 'namespaces must be a list of strings'}), 400
+        graphs = [
+            _graph_data_from_payload(g, default_namespaces) if isinstance(g, dict) else None
+            for g in data['graphs']
+        ]
+        if any(graph_data is None for graph_data in graphs):
+            return jsonify({'error': 'Missing or invalid fields'}), 400
+        # Un même graph_type deux fois : seul le dernier serait gardé, la requête est ambiguë
+        if len({graph_data.graph_type for graph_data in graphs}) != len(graphs):
+            return jsonify({'error': 'Duplicate graph_type in graphs'}), 400
+
+        stored = storage.store_many(graphs)
+        unchanged = len(data['graphs']) - stored
+        # Comme /api/graph : 200 « unchanged » si aucun graphe n'a changé, 201 sinon
+        if not stored:
+            return jsonify({'status': 'unchanged', 'stored': 0, 'unchanged': unchanged}), 200
+        return jsonify({'status': 'success', 'stored': stored, 'unchanged': unchanged}), 201
+
     @app.route('/api/graph/status', methods=['GET'])
     def api_graph_status():
         return jsonify(get_storage().get_status())
@@ -163,7 +708,8 @@ def create_app(config) -> Flask:
         graph_data = get_storage().get(graph_type)
         if not graph_data:
             return jsonify({'error': 'Graph not found'}), 404
-        return Response(graph_data.dot_content, mimetype='text/plain')
+        return _conditional_response(graph_data.dot_content, 'text/plain', graph_data.digest,
+                                     gzip_payload=lambda: graph_data.dot_gzip)
 
     # ... (les autres routes API de gestion de cache restent les mêmes)
 
@@ -174,32 +720,43 @@ def create_app(config) -> Flask:
         if not original_graph:
             return jsonify({'error': f'Graph "{graph_type}" not found in cache'}), 404
 
-        filters = request.get_json()
-        namespaces = filters.get('namespaces', [])
-        keywords = filters.get('keywords', [])
+        try:
+            graph_filter = _GraphFilter.from_dict(_read_json_payload())
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
 
-        filtered_dot = _filter_dot_content(original_graph.dot_content, namespaces, keywords)
-        svg_content = _convert_dot_to_svg(filtered_dot, f"{graph_type}_filtered")
+        svg_content = _render_filtered_svg(original_graph, graph_filter)
 
         if svg_content:
             return Response(svg_content, mimetype='image/svg+xml')
         else:
-            error_svg = '''<svg ...>SVG Conversion Failed...</svg>'''
-            return Response(error_svg, mimetype='image/svg+xml'), 500
+            return Response(ERROR_SVG_CONVERSION_FAILED, status=500, mimetype='image/svg+xml')
+
+    @app.route('/api/graph/filtered_batch/<graph_type>', methods=['POST'])
+    def api_get_filtered_graphs_batch(graph_type):
+        """Rend plusieurs filtres d'un graphe en une requête, avec un seul appel à Graphviz."""
+        original_graph = get_storage().get(graph_type)
+        if not original_graph:
+            return jsonify({'error': f'Graph "{graph_type}" not found in cache'}), 404
+
+        data = _read_json_payload()
+        if not isinstance(data, dict) or not isinstance(data.get('filters'), list):
+            return jsonify({'error': 'Invalid JSON payload'}), 400
+        if len(data['filters']) > MAX_FILTERS_PER_BATCH:
+            return jsonify({'error': f'At most {MAX_FILTERS_PER_BATCH} filters per batch'}), 400
+        try:
+            graph_filters = [_GraphFilter.from_dict(filters) for filters in data['filters']]
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        svgs = _render_filtered_svgs(original_graph, graph_filters)
+        if svgs is None:
+            return jsonify({'error': 'SVG Conversion Failed'}), 500
+        return jsonify({'svgs': [svg_content.decode('utf-8') for svg_content in svgs]})
 
     @app.route('/')
     def index():
-        storage = get_storage()
-        status = storage.get_status()
-        namespaces = set()
-        stats = {'events': 0, 'agents': 0, 'connections': 0}
-
-        if status['total_graphs'] > 0:
-            for graph_info in status['graphs'].values():
-                stats['events'] = max(stats['events'], graph_info.get('stats', {}).get('events', 0))
-                stats['agents'] = max(stats['agents'], graph_info.get('stats', {}).get('agents', 0))
-                stats['connections'] = max(stats['connections'], graph_info.get('stats', {}).get('connections', 0))
-                namespaces.update(graph_info.get('namespaces', []))
+        aggregate = get_storage().get_aggregate()
 
         return render_template(
             'event_flow.html',
@@ -207,13 +764,13 @@ def create_app(config) -> Flask:
             subtitle='Trading Bot Architecture',
             active_page='event_flow',
             footer_text='🤖 Trading Bot Event-Driven Architecture | <kbd>Ctrl+R</kbd> to refresh',
-            total_events=stats['events'],
-            total_agents=stats['agents'],
-            total_connections=stats['connections'],
-            total_namespaces=len(namespaces),
-            namespaces=sorted(list(namespaces)),
+            total_events=aggregate['events'],
+            total_agents=aggregate['agents'],
+            total_connections=aggregate['connections'],
+            total_namespaces=len(aggregate['namespaces']),
+            namespaces=list(aggregate['namespaces']),
             namespace_colors={},
-            cache_empty=(status['total_graphs'] == 0)
+            cache_empty=(aggregate['total_graphs'] == 0)
         )
 
     # La route /graph/<graph_type> devient obsolète pour l'affichage mais on la garde comme fallback
@@ -222,13 +779,28 @@ def create_app(config) -> Flask:
         storage = get_storage()
         cached_graph = storage.get(graph_type)
         if not cached_graph:
-            return Response(f"Graph '{graph_type}' not found.", status=404, mimetype='image/svg+xml')
+            not_found_svg = ERROR_SVG_NOT_FOUND_TEMPLATE % html.escape(graph_type).encode('utf-8')
+            return Response(not_found_svg, status=404, mimetype='image/svg+xml')
+
+        # Graphe inchangé côté client : inutile même de le rendre
+        not_modified = _not_modified(cached_graph.digest)
+        if not_modified is not None:
+            return not_modified
+
+        svg_content = cached_graph.rendered_svg
+        if svg_content is None:
+            # Rendu hors du thread de requête, partagé entre les requêtes simultanées pour ce graphe
+            try:
+                svg_content = _full_svg_future(cached_graph).result(timeout=RENDER_WAIT_SECONDS)
+            except FutureTimeoutError:
+                return Response(status=202,
+                                headers={'Retry-After': str(RENDER_RETRY_AFTER_SECONDS)})
 
-        svg_content = cached_graph.svg_content or _convert_dot_to_svg(cached_graph.dot_content, graph_type)
         if svg_content:
-            return Response(svg_content, mimetype='image/svg+xml')
+            return _conditional_response(svg_content, 'image/svg+xml', cached_graph.digest,
+                                         gzip_payload=cached_graph.rendered_svg_gzip)
         else:
-            return Response("SVG Conversion Failed.", status=500, mimetype='image/svg+xml')
+            return Response(ERROR_SVG_CONVERSION_FAILED, status=500, mimetype='image/svg+xml')
 
     return app
 
@@ -4,6 +4,7 @@ Event Flow Server - Serveur web pour la visualisation des flux d'événements.
 from __future__ import annotations
 
 from .serve_event_flow import create_app
+from ..wsgi import run_app
 
 
 class EventFlowServer:
@@ -21,12 +22,16 @@ class EventFlowServer:
         # Créer l'application Flask en utilisant la factory
         self.app = create_app(config)
 
-    def run(self, host='0.0.0.0', debug=True):
+    def run(self, host='0.0.0.0', debug=False):
         """Lance le serveur Flask (bloquant).
 
+        Hors mode debug, le serveur WSGI waitress est utilisé s'il est installé (voir
+        run_app) : plusieurs requêtes, et donc plusieurs conversions Graphviz, sont
+        traitées en parallèle.
+
         Args:
             host: Adresse d'écoute (défaut: 0.0.0.0)
-            debug: Activer le mode debug (défaut: True)
+            debug: Activer le mode debug (défaut: False)
         """
         print("=" * 80)
         print("🚀 Event Flow Visualization Server")
@@ -39,4 +44,4 @@ class EventFlowServer:
         print("=" * 80)
         print()
 
-        self.app.run(host=host, port=self.port, debug=debug)
+        run_app(self.app, host=host, port=self.port, debug=debug)
@@ -5,16 +5,32 @@ Stores precomputed DOT and SVG data for different graph types.
 """
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
 import logging
 import threading
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from .dot_index import DotIndex, parse_dot
 
 logger = logging.getLogger(__name__)
 
+# Statistics reported by the scanner for each graph
+GRAPH_STAT_KEYS = ('events', 'agents', 'connections')
+
+
+def is_valid_stats(stats) -> bool:
+    """Check that graph stats are a dict of integer counts keyed by name (booleans rejected)."""
+    return isinstance(stats, dict) and all(
+        isinstance(key, str) and isinstance(value, int) and not isinstance(value, bool)
+        for key, value in stats.items()
+    )
+
 
 @dataclass
 class GraphData:
@@ -27,13 +43,75 @@ class GraphData:
     stats: Dict[str, int] = field(default_factory=dict)
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
+    # Full-graph SVG bytes and their gzip encoding, filled by render_svg() and
+    # rendered_svg_gzip() (not annotated, hence not dataclass fields)
+    _rendered_svg = None
+    _rendered_svg_gzip = None
+
+    @cached_property
+    def dot_index(self) -> DotIndex:
+        """
+        Pre-parsed DOT, built on first use and kept for the lifetime of the graph.
+
+        Not a dataclass field, so it is neither serialized nor compared.
+        """
+        return parse_dot(self.dot_content)
+
+    @cached_property
+    def sorted_namespaces(self) -> Tuple[str, ...]:
+        """Namespaces in sorted order, computed once (status, serialization and dashboard)."""
+        return tuple(sorted(self.namespaces))
+
+    @cached_property
+    def digest(self) -> str:
+        """Short hash of the DOT and SVG payloads (cache keys and HTTP ETags)."""
+        hasher = hashlib.blake2b(self.dot_content.encode('utf-8'), digest_size=16)
+        if self.svg_content is not None:
+            hasher.update(b'\0' + self.svg_content.encode('utf-8'))
+        return hasher.hexdigest()
+
+    @cached_property
+    def dot_gzip(self) -> bytes:
+        """DOT payload compressed once, served as-is to clients accepting gzip."""
+        return gzip.compress(self.dot_content.encode('utf-8'), compresslevel=6)
+
+    @property
+    def rendered_svg(self) -> Optional[bytes]:
+        """Full-graph SVG if known without rendering (scanner svg_content or an earlier render)."""
+        if self._rendered_svg is None and self.svg_content:
+            self._rendered_svg = self.svg_content.encode('utf-8')
+        return self._rendered_svg
+
+    def render_svg(self, convert: Callable[[str, str], Optional[bytes]]) -> Optional[bytes]:
+        """
+        Get the full-graph SVG, rendering it at most once per graph.
+
+        The scanner's svg_content is used when provided; otherwise the DOT is passed to
+        convert(dot_content, graph_type). A successful result is kept on the instance, so
+        it lives exactly as long as the graph stays cached. Failures are retried on the next call.
+        """
+        if self.rendered_svg is None:
+            self._rendered_svg = convert(self.dot_content, self.graph_type)
+        return self._rendered_svg
+
+    def rendered_svg_gzip(self) -> Optional[bytes]:
+        """Gzip encoding of the SVG kept by render_svg(), compressed once (None until rendered)."""
+        if self._rendered_svg_gzip is None and self._rendered_svg is not None:
+            self._rendered_svg_gzip = gzip.compress(self._rendered_svg, compresslevel=6)
+        return self._rendered_svg_gzip
+
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
         data = asdict(self)
         # Convert set to list for JSON
-        data['namespaces'] = sorted(list(self.namespaces))
+        data['namespaces'] = list(self.sorted_namespaces)
         return data
 
+    @cached_property
+    def json_text(self) -> str:
+        """to_dict() serialized once: unchanged graphs are not re-encoded on every cache save."""
+        return json.dumps(self.to_dict())
+
     @classmethod
     def from_dict(cls, data: Dict) -> GraphData:
         """Create from dictionary"""
@@ -45,6 +123,16 @@ class GraphData:
         return cls(**data)
 
 
+def _same_content(current: GraphData, candidate: GraphData) -> bool:
+    """Check whether two graphs carry the same payload, ignoring their timestamps."""
+    return (
+            current.dot_content == candidate.dot_content
+            and current.svg_content == candidate.svg_content
+            and current.namespaces == candidate.namespaces
+            and current.stats == candidate.stats
+    )
+
+
 class GraphStorage:
     """
     Thread-safe in-memory storage for graph data with optional disk persistence.
@@ -60,16 +148,64 @@ class GraphStorage:
         self._graphs: Dict[str, GraphData] = {}
         self._lock = threading.RLock()
         self._persist_path = persist_path
+        self._aggregate: Dict = {}
+        self._refresh_aggregate()
 
         if self._persist_path:
             self._load_from_disk()
 
-    def store(self, graph_data: GraphData) -> None:
-        """Store graph data and persist to disk if configured."""
+    def store(self, graph_data: GraphData) -> bool:
+        """
+        Store graph data and persist to disk if configured.
+
+        A scanner running in continuous mode re-sends the same graph on every
+        cycle; when the content is identical to the cached one the call is a
+        no-op, so neither the timestamp nor the on-disk cache is rewritten.
+
+        Returns:
+            True if the graph was stored, False if it was unchanged.
+        """
+        return self.store_many((graph_data,)) == 1
+
+    def store_many(self, graphs: Iterable[GraphData]) -> int:
+        """
+        Store several graphs at once, persisting to disk a single time.
+
+        Unchanged graphs are skipped exactly as in store(). The batch is applied
+        all-or-nothing: nothing is stored if one of the graphs is invalid.
+
+        Raises:
+            ValueError: If a graph's stats are not a dict of integers.
+
+        Returns:
+            Number of distinct graph types actually stored.
+        """
+        graphs = list(graphs)
+        invalid = [graph_data.graph_type for graph_data in graphs
+                   if not is_valid_stats(graph_data.stats)]
+        if invalid:
+            raise ValueError(f"Invalid stats for graph(s): {', '.join(invalid)}")
+
         with self._lock:
-            self._graphs[graph_data.graph_type] = graph_data
-            if self._persist_path:
-                self._save_to_disk()
+            # Changes are staged on a copy, so a failure leaves the cache and aggregate untouched
+            updated = dict(self._graphs)
+            # Counted per graph type: a type repeated in the batch is stored (and counted) once
+            changed = set()
+            for graph_data in graphs:
+                current = updated.get(graph_data.graph_type)
+                if current is not None and _same_content(current, graph_data):
+                    continue
+                updated[graph_data.graph_type] = graph_data
+                changed.add(graph_data.graph_type)
+            stored = len(changed)
+
+            if stored:
+                aggregate = self._compute_aggregate(updated)
+                self._graphs = updated
+                self._aggregate = aggregate
+                if self._persist_path:
+                    self._save_to_disk()
+            return stored
 
     def get(self, graph_type: str) -> Optional[GraphData]:
         """Retrieve graph data by type."""
@@ -93,10 +229,41 @@ class GraphStorage:
                 self._graphs.pop(graph_type, None)
             else:
                 self._graphs.clear()
+            self._refresh_aggregate()
 
             if self._persist_path:
                 self._save_to_disk()
 
+    def get_aggregate(self) -> Dict:
+        """
+        Get totals across all cached graphs, as shown on the dashboard.
+
+        Maintained on every write, so reading it does not scan the graphs.
+
+        Returns:
+            The maximum of each stat over the graphs ('events', 'agents', 'connections'),
+            'namespaces' (sorted tuple of all graphs' namespaces) and 'total_graphs'.
+        """
+        with self._lock:
+            return dict(self._aggregate)
+
+    @staticmethod
+    def _compute_aggregate(graphs: Dict[str, GraphData]) -> Dict:
+        """Compute the cross-graph totals returned by get_aggregate()."""
+        aggregate = {
+            key: max((graph.stats.get(key, 0) for graph in graphs.values()), default=0)
+            for key in GRAPH_STAT_KEYS
+        }
+        namespaces = set().union(*(graph.sorted_namespaces for graph in graphs.values()))
+        aggregate['namespaces'] = tuple(sorted(namespaces))
+        aggregate['total_graphs'] = len(graphs)
+        return aggregate
+
+    def _refresh_aggregate(self) -> None:
+        """Recompute the cross-graph totals from the current graphs."""
+        with self._lock:
+            self._aggregate = self._compute_aggregate(self._graphs)
+
     def get_status(self) -> Dict:
         """Get cache status information."""
         with self._lock:
@@ -112,7 +279,7 @@ class GraphStorage:
                     'timestamp': data.timestamp,
                     'has_svg': data.svg_content is not None,
                     'stats': data.stats,
-                    'namespaces': sorted(list(data.namespaces))
+                    'namespaces': list(data.sorted_namespaces)
                 }
             return status
 
@@ -124,11 +291,14 @@ class GraphStorage:
         with self._lock:
             try:
                 self._persist_path.parent.mkdir(parents=True, exist_ok=True)
-                data = {gt: gd.to_dict() for gt, gd in self._graphs.items()}
+                # Each graph contributes its memoized JSON; only new graphs are serialized
+                entries = ',\n'.join(
+                    f'  {json.dumps(gt)}: {gd.json_text}' for gt, gd in self._graphs.items()
+                )
 
                 temp_path = self._persist_path.with_suffix('.tmp')
                 with open(temp_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
+                    f.write(f'{{\n{entries}\n}}\n')
                 temp_path.replace(self._persist_path)
                 logger.debug(f"Cache saved to {self._persist_path}")
             except (IOError, OSError) as e:
@@ -143,11 +313,19 @@ class GraphStorage:
             try:
                 with open(self._persist_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                self._graphs = {gt: GraphData.from_dict(gd) for gt, gd in data.items()}
+                graphs = {gt: GraphData.from_dict(gd) for gt, gd in data.items()}
+                invalid = [gt for gt, gd in graphs.items() if not is_valid_stats(gd.stats)]
+                if invalid:
+                    logger.warning(
+                        f"Ignoring cached graph(s) with invalid stats: {', '.join(invalid)}"
+                    )
+                self._graphs = {gt: gd for gt, gd in graphs.items() if gt not in invalid}
+                self._refresh_aggregate()
                 logger.info(f"Cache loaded from {self._persist_path}")
             except (IOError, json.JSONDecodeError) as e:
                 logger.error(f"Failed to load cache from disk ({self._persist_path}): {e}")
                 self._graphs = {}
+                self._refresh_aggregate()
 
 
 # --- Singleton Pattern for Global Access ---
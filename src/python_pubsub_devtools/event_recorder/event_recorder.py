@@ -11,6 +11,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Callable, Any
 
+from .recording_manager import write_recording_file
+
 
 class EventRecorder:
     """Record all events to disk for later replay
@@ -109,8 +111,7 @@ class EventRecorder:
             "events": self.events
         }
 
-        with open(filepath, 'w') as f:
-            json.dump(recording_data, f, indent=2)
+        write_recording_file(filepath, recording_data)
 
         print(f"💾 Recording saved: {filepath}")
         print(f"   - Total events: {len(self.events)}")
@@ -123,31 +123,33 @@ class PlayerManager:
 
         print(f"🎬 Starting replay of {len(events)} events to {len(players_to_replay)} player(s)")
 
-        for i, event in enumerate(events):
-            # Calculer le délai entre événements
-            if i > 0:
-                delay_ms = event['timestamp_offset_ms'] - events[i - 1]['timestamp_offset_ms']
-                delay_seconds = (delay_ms / 1000.0) / speed
-                if delay_seconds > 0:
-                    time.sleep(delay_seconds)
-
-            # Envoyer à tous les players cibles
-            for player_name, player_endpoint in players_to_replay.items():
-                try:
-                    response = requests.post(
-                        player_endpoint,
-                        json={
-                            'event_name': event['event_name'],
-                            'event_data': event['event_data'],
-                            'source': event.get('source', 'DevToolsReplay')
-                        },
-                        timeout=5
-                    )
-                    response.raise_for_status()
-                    replayed_count += 1
-                except requests.RequestException as e:
-                    print(f"❌ Failed to replay event to {player_name}: {e}")
-                    failed_count += 1
+        # Une session pour tout le replay : connexions keep-alive réutilisées entre événements
+        with requests.Session() as session:
+            for i, event in enumerate(events):
+                # Calculer le délai entre événements
+                if i > 0:
+                    delay_ms = event['timestamp_offset_ms'] - events[i - 1]['timestamp_offset_ms']
+                    delay_seconds = (delay_ms / 1000.0) / speed
+                    if delay_seconds > 0:
+                        time.sleep(delay_seconds)
+
+                # Envoyer à tous les players cibles
+                for player_name, player_endpoint in players_to_replay.items():
+                    try:
+                        response = session.post(
+                            player_endpoint,
+                            json={
+                                'event_name': event['event_name'],
+                                'event_data': event['event_data'],
+                                'source': event.get('source', 'DevToolsReplay')
+                            },
+                            timeout=5
+                        )
+                        response.raise_for_status()
+                        replayed_count += 1
+                    except requests.RequestException as e:
+                        print(f"❌ Failed to replay event to {player_name}: {e}")
+                        failed_count += 1
 
         print(f"✓ Replay completed: {replayed_count} events replayed, {failed_count} failed")
 
@@ -4,12 +4,53 @@ Gestion des sessions d'enregistrement d'événements.
 from __future__ import annotations
 
 import json
+import os
+import tempfile
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 
+def _read_umask() -> int:
+    """Lit le umask du processus (os.umask ne permet de le lire qu'en le remplaçant)."""
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+# Mode d'un fichier créé par un simple open() : NamedTemporaryFile crée ses fichiers en 0600.
+# Le umask est lu une fois au chargement, os.umask() n'étant pas sûr entre threads.
+_RECORDING_FILE_MODE = 0o666 & ~_read_umask()
+
+
+def write_recording_file(filepath: Path, recording_data: Dict[str, Any]) -> None:
+    """
+    Écrit un enregistrement JSON de façon atomique.
+
+    Le contenu est d'abord écrit dans un fichier temporaire au nom unique (extension
+    .tmp, donc ignoré par le tableau de bord) puis renommé : un lecteur concurrent ne
+    voit jamais un enregistrement tronqué, et deux écritures simultanées du même
+    enregistrement ne partagent pas le même fichier temporaire. En cas d'échec, le
+    fichier temporaire est supprimé. Le fichier final reçoit les permissions qu'aurait
+    données un open() classique (0666 moins le umask).
+
+    Args:
+        filepath: Chemin final du fichier d'enregistrement
+        recording_data: Contenu de l'enregistrement
+    """
+    temp_file = tempfile.NamedTemporaryFile('w', dir=filepath.parent, prefix=f'.{filepath.stem}.',
+                                            suffix='.tmp', delete=False)
+    try:
+        with temp_file:
+            json.dump(recording_data, temp_file, indent=2)
+        os.chmod(temp_file.name, _RECORDING_FILE_MODE)
+        os.replace(temp_file.name, filepath)
+    except BaseException:
+        os.unlink(temp_file.name)
+        raise
+
+
 class RecordingManager:
     """
     Gestionnaire centralisé des sessions d'enregistrement.
@@ -170,8 +211,7 @@ class RecordingManager:
                 'events': events
             }
 
-            with open(filepath, 'w') as f:
-                json.dump(recording_data, f, indent=2)
+            write_recording_file(filepath, recording_data)
 
             event_count = len(events)
 
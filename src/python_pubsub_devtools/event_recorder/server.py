@@ -8,6 +8,7 @@ from pathlib import Path
 from flask import Flask
 
 from ..config import EventRecorderConfig
+from ..wsgi import run_app
 
 
 def create_app(config: EventRecorderConfig) -> Flask:
@@ -77,7 +78,7 @@ class EventRecorderServer:
         self.port = config.port
         self.app = create_app(config)
 
-    def run(self, host: str = '0.0.0.0', debug: bool = True) -> None:
+    def run(self, host: str = '0.0.0.0', debug: bool = False) -> None:
         """Lance le serveur Flask (bloquant).
 
         Cette méthode est bloquante. Pour une utilisation dans un processus séparé,
@@ -85,7 +86,7 @@ class EventRecorderServer:
 
         Args:
             host: Adresse d'écoute (défaut: 0.0.0.0)
-            debug: Mode debug Flask (défaut: True)
+            debug: Mode debug Flask (défaut: False)
         """
         # Compter les enregistrements
         recording_count = len(list(self.recordings_dir.glob('*.json')))
@@ -103,4 +104,4 @@ class EventRecorderServer:
         print("=" * 80)
         print()
 
-        self.app.run(host=host, port=self.port, debug=debug)
+        run_app(self.app, host=host, port=self.port, debug=debug)
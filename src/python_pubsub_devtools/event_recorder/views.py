@@ -4,16 +4,17 @@ Routes Flask pour le tableau de bord Event Recorder.
 from __future__ import annotations
 
 import json
+import os
 import threading
 from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from flask import Flask, render_template, jsonify, current_app
 
 from .player_manager import PlayerManager
-from .recording_manager import RecordingManager
+from .recording_manager import RecordingManager, write_recording_file
 
 # État global du replay
 replay_state: Dict[str, Any] = {
@@ -34,6 +35,11 @@ replay_lock = threading.Lock()
 player_manager: Optional[PlayerManager] = None
 recording_manager: Optional[RecordingManager] = None
 
+# Cache des résumés d'enregistrements:
+# (répertoire, fichier) -> ((mtime_ns, taille), métadonnées, durée en secondes)
+_summary_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], Dict[str, Any], float]] = {}
+_summary_cache_lock = threading.Lock()
+
 
 def load_recording(filename: str) -> Optional[Dict[str, Any]]:
     """Charge un fichier d'enregistrement.
@@ -71,6 +77,20 @@ def get_recording_metadata(filename: str) -> Optional[Dict[str, Any]]:
     if not recording:
         return None
 
+    metadata, _ = _summarize_recording(filename, recording)
+    return metadata
+
+
+def _summarize_recording(filename: str, recording: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+    """Calcule les métadonnées d'affichage et la durée d'un enregistrement chargé.
+
+    Args:
+        filename: Nom du fichier d'enregistrement
+        recording: Contenu JSON de l'enregistrement
+
+    Returns:
+        Tuple (métadonnées, durée en secondes)
+    """
     # Support des deux formats: avec clé 'metadata' ou structure plate
     if 'metadata' in recording:
         metadata = recording['metadata']
@@ -81,6 +101,7 @@ def get_recording_metadata(filename: str) -> Optional[Dict[str, Any]]:
         events = recording.get('events', [])
 
     # Calculer la durée
+    duration_seconds = 0.0
     if events:
         duration_ms = events[-1]['timestamp_offset_ms']
         duration_seconds = duration_ms / 1000
@@ -111,27 +132,117 @@ def get_recording_metadata(filename: str) -> Optional[Dict[str, Any]]:
         'duration': duration_str,
         'event_count': len(events),
         'unique_events': unique_events,
-    }
+    }, duration_seconds
 
 
-def get_all_recordings() -> List[Dict[str, Any]]:
-    """Liste tous les enregistrements disponibles.
+def get_recording_summary(recordings_dir: Path,
+                          filename: str) -> Optional[Tuple[Dict[str, Any], float]]:
+    """Retourne les métadonnées et la durée d'un enregistrement, avec cache par mtime.
+
+    Le fichier n'est relu et parsé que si sa date de modification ou sa taille a
+    changé depuis le dernier appel : un rafraîchissement du tableau de bord ne
+    coûte alors qu'un stat() par enregistrement inchangé.
+
+    Args:
+        recordings_dir: Répertoire des enregistrements
+        filename: Nom du fichier d'enregistrement
 
     Returns:
-        Liste des métadonnées de tous les enregistrements
+        Tuple (métadonnées, durée en secondes) ou None si erreur
+    """
+    file_path = recordings_dir / filename
+    cache_key = (str(recordings_dir), filename)
+    try:
+        file_stat = file_path.stat()
+    except OSError:
+        with _summary_cache_lock:
+            _summary_cache.pop(cache_key, None)
+        return None
+
+    signature = (file_stat.st_mtime_ns, file_stat.st_size)
+    with _summary_cache_lock:
+        cached = _summary_cache.get(cache_key)
+    if cached and cached[0] == signature:
+        return dict(cached[1]), cached[2]
+
+    recording = load_recording(filename)
+    if not recording:
+        return None
+
+    metadata, duration_seconds = _summarize_recording(filename, recording)
+    with _summary_cache_lock:
+        _summary_cache[cache_key] = (signature, metadata, duration_seconds)
+    return dict(metadata), duration_seconds
+
+
+def list_recording_filenames(recordings_dir: Path) -> List[str]:
+    """Liste les noms des fichiers d'enregistrement JSON d'un répertoire.
+
+    Utilise os.scandir plutôt que Path.glob : le type de chaque entrée est connu
+    sans stat() supplémentaire et aucun objet Path n'est construit par fichier.
+
+    Args:
+        recordings_dir: Répertoire des enregistrements
+
+    Returns:
+        Noms des fichiers *.json présents (vide si le répertoire n'existe pas)
+    """
+    try:
+        with os.scandir(recordings_dir) as entries:
+            return [entry.name for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def _prune_summary_cache(recordings_dir: Path, filenames: List[str]) -> None:
+    """Retire du cache les résumés des enregistrements qui ne sont plus listés.
+
+    Un fichier supprimé n'est plus jamais relu par get_recording_summary() :
+    son entrée doit être retirée ici, à partir du listage courant.
+
+    Args:
+        recordings_dir: Répertoire des enregistrements
+        filenames: Noms des fichiers actuellement présents dans le répertoire
+    """
+    directory = str(recordings_dir)
+    present = set(filenames)
+    with _summary_cache_lock:
+        stale = [key for key in _summary_cache if key[0] == directory and key[1] not in present]
+        for key in stale:
+            del _summary_cache[key]
+
+
+def get_all_recording_summaries() -> List[Tuple[Dict[str, Any], float]]:
+    """Liste les résumés (métadonnées, durée) de tous les enregistrements disponibles.
+
+    Returns:
+        Liste de tuples (métadonnées, durée en secondes), triée par created_at décroissant
     """
-    recordings = []
     recordings_dir = Path(current_app.config['RECORDINGS_DIR'])
+    summaries = []
 
-    for file_path in recordings_dir.glob('*.json'):
-        metadata = get_recording_metadata(file_path.name)
-        if metadata:
-            recordings.append(metadata)
+    filenames = list_recording_filenames(recordings_dir)
+    _prune_summary_cache(recordings_dir, filenames)
+
+    for filename in filenames:
+        summary = get_recording_summary(recordings_dir, filename)
+        if summary:
+            summaries.append(summary)
 
     # Trier par created_at décroissant
-    recordings.sort(key=lambda x: x['created_at'], reverse=True)
+    summaries.sort(key=lambda x: x[0]['created_at'], reverse=True)
+
+    return summaries
+
+
+def get_all_recordings() -> List[Dict[str, Any]]:
+    """Liste tous les enregistrements disponibles.
 
-    return recordings
+    Returns:
+        Liste des métadonnées de tous les enregistrements
+    """
+    return [metadata for metadata, _ in get_all_recording_summaries()]
 
 
 def register_routes(app: Flask) -> None:
@@ -150,21 +261,15 @@ def register_routes(app: Flask) -> None:
     @app.route('/')
     def index():
         """Page principale avec la liste des enregistrements."""
-        recordings = get_all_recordings()
+        summaries = get_all_recording_summaries()
+        recordings = [metadata for metadata, _ in summaries]
 
         # Calculer les statistiques
         total_recordings = len(recordings)
         total_events = sum(r['event_count'] for r in recordings)
 
         # Calculer la durée totale
-        total_duration_seconds = 0
-        recordings_dir = Path(current_app.config['RECORDINGS_DIR'])
-
-        for recording_file in recordings_dir.glob('*.json'):
-            recording = load_recording(recording_file.name)
-            if recording and recording.get('events'):
-                duration_ms = recording['events'][-1]['timestamp_offset_ms']
-                total_duration_seconds += duration_ms / 1000
+        total_duration_seconds = sum(duration_seconds for _, duration_seconds in summaries)
 
         if total_duration_seconds < 60:
             total_duration = f"{total_duration_seconds:.0f}s"
@@ -373,8 +478,7 @@ def register_routes(app: Flask) -> None:
             'events': selected_events
         }
 
-        with open(new_filepath, 'w') as f:
-            json.dump(new_recording, f, indent=2)
+        write_recording_file(new_filepath, new_recording)
 
         return jsonify({
             'success': True,
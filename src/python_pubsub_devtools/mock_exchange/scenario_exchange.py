@@ -210,62 +210,68 @@ class ScenarioBasedMockExchange:
         """
         logger.info("Thread push démarré")
 
-        while not self._stop_thread_event.is_set():
-            with self._replay_state_lock:
-                if self._replay_status != "running":
-                    break
+        # Session dédiée au thread : les connexions keep-alive vers chaque receiver
+        # sont réutilisées d'une chandelle à l'autre au lieu d'être rouvertes
+        with requests.Session() as session:
+            while not self._stop_thread_event.is_set():
+                with self._replay_state_lock:
+                    if self._replay_status != "running":
+                        break
 
-                if self._current_index >= len(self._candles):
-                    self._replay_status = "completed"
-                    self._add_log("info", "Replay terminé")
-                    logger.info("Replay terminé")
-                    break
+                    if self._current_index >= len(self._candles):
+                        self._replay_status = "completed"
+                        self._add_log("info", "Replay terminé")
+                        logger.info("Replay terminé")
+                        break
 
-                # Récupérer la chandelle courante
-                candle = self._candles[self._current_index]
+                    # Récupérer la chandelle courante
+                    candle = self._candles[self._current_index]
 
-            # Envoyer aux receivers (hors du lock pour éviter les blocages)
-            receivers = self.get_receivers()
-            if not receivers:
-                logger.warning("Aucun receiver disponible, arrêt du push")
-                with self._replay_state_lock:
-                    self._add_log("warning", "Aucun receiver disponible")
-                    self._replay_status = "stopped"
-                break
-
-            # Envoyer à tous les receivers
-            for receiver in receivers:
-                endpoint = receiver.get('player_endpoint') or receiver.get('receiver_endpoint')
-                consumer_name = receiver.get('consumer_name', 'Unknown')
-
-                if not endpoint:
-                    continue
-
-                try:
-                    response = requests.post(
-                        endpoint,
-                        json={'candle': candle, 'index': self._current_index},
-                        timeout=2.0
-                    )
-                    if response.ok:
-                        logger.debug(f"Chandelle {self._current_index} envoyée à {consumer_name}")
-                    else:
-                        logger.warning(f"Erreur HTTP {response.status_code} de {consumer_name}")
-                        with self._replay_state_lock:
-                            self._add_log("warning", f"{consumer_name}: HTTP {response.status_code}")
-                except requests.exceptions.RequestException as e:
-                    logger.error(f"Erreur d'envoi à {consumer_name}: {e}")
+                # Envoyer aux receivers (hors du lock pour éviter les blocages)
+                receivers = self.get_receivers()
+                if not receivers:
+                    logger.warning("Aucun receiver disponible, arrêt du push")
                     with self._replay_state_lock:
-                        self._add_log("error", f"{consumer_name}: {str(e)}")
+                        self._add_log("warning", "Aucun receiver disponible")
+                        self._replay_status = "stopped"
+                    break
 
-            # Incrémenter l'index et logger
-            with self._replay_state_lock:
-                self._current_index += 1
-                if self._current_index % 10 == 0:  # Log tous les 10 candles
-                    self._add_log("info", f"Progression: {self._current_index}/{len(self._candles)}")
+                # Envoyer à tous les receivers
+                for receiver in receivers:
+                    endpoint = receiver.get('player_endpoint') or receiver.get('receiver_endpoint')
+                    consumer_name = receiver.get('consumer_name', 'Unknown')
+
+                    if not endpoint:
+                        continue
+
+                    try:
+                        response = session.post(
+                            endpoint,
+                            json={'candle': candle, 'index': self._current_index},
+                            timeout=2.0
+                        )
+                        if response.ok:
+                            logger.debug(
+                                f"Chandelle {self._current_index} envoyée à {consumer_name}")
+                        else:
+                            logger.warning(f"Erreur HTTP {response.status_code} de {consumer_name}")
+                            with self._replay_state_lock:
+                                self._add_log("warning",
+                                              f"{consumer_name}: HTTP {response.status_code}")
+                    except requests.exceptions.RequestException as e:
+                        logger.error(f"Erreur d'envoi à {consumer_name}: {e}")
+                        with self._replay_state_lock:
+                            self._add_log("error", f"{consumer_name}: {str(e)}")
+
+                # Incrémenter l'index et logger
+                with self._replay_state_lock:
+                    self._current_index += 1
+                    if self._current_index % 10 == 0:  # Log tous les 10 candles
+                        self._add_log(
+                            "info", f"Progression: {self._current_index}/{len(self._candles)}")
 
-            # Attendre l'intervalle
-            time.sleep(self._interval_seconds)
+                # Attendre l'intervalle
+                time.sleep(self._interval_seconds)
 
         logger.info("Thread push terminé")
 
@@ -10,6 +10,8 @@ from typing import Any
 
 from flask import Flask
 
+from ..wsgi import run_app
+
 
 def create_app(config: Any, service_bus: Any) -> Flask:
     """
@@ -94,4 +96,4 @@ class MockExchangeServer:
         print("=" * 80)
         print()
 
-        self.app.run(host=host, port=self.port, debug=debug)
+        run_app(self.app, host=host, port=self.port, debug=debug)
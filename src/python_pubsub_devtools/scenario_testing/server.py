@@ -9,6 +9,7 @@ from typing import Any
 from flask import Flask, g
 
 from ..config import ScenarioTestingConfig
+from ..wsgi import run_app
 
 
 def create_app(config: ScenarioTestingConfig) -> Flask:
@@ -124,4 +125,4 @@ class ScenarioTestingServer:
         self.app.config['SERVICE_BUS'] = self.service_bus
 
         # threaded=True est nécessaire pour gérer les tests en background
-        self.app.run(host=host, port=self.port, debug=debug, threaded=True)
+        run_app(self.app, host=host, port=self.port, debug=debug)
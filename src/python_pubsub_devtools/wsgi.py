@@ -0,0 +1,33 @@
+"""
+WSGI - Lancement commun des applications Flask des outils.
+
+Hors mode debug, les serveurs utilisent waitress s'il est installé
+(`pip install python_pubsub_devtools[server]`) : un vrai serveur WSGI multi-thread,
+sans le rechargement ni le débogueur du serveur de développement Werkzeug.
+À défaut, le serveur de développement Flask est lancé en mode multi-thread.
+"""
+from __future__ import annotations
+
+import os
+
+from flask import Flask
+
+try:
+    from waitress import serve as waitress_serve
+except ImportError:  # waitress est optionnel (extra "server")
+    waitress_serve = None
+
+
+def run_app(app: Flask, host: str, port: int, debug: bool = False) -> None:
+    """Lance une application Flask (bloquant).
+
+    Args:
+        app: Application Flask à servir
+        host: Adresse d'écoute
+        port: Port d'écoute
+        debug: Mode debug Flask (force le serveur de développement)
+    """
+    if debug or waitress_serve is None:
+        app.run(host=host, port=port, debug=debug, threaded=True)
+    else:
+        waitress_serve(app, host=host, port=port, threads=max(8, os.cpu_count() or 1))
@@ -0,0 +1,53 @@
+"""Tests pour la supervision des services lancés par `pubsub-tools serve-all`."""
+import multiprocessing
+import sys
+import time
+
+from python_pubsub_devtools.cli.main import _supervise_processes, _terminate_processes
+
+
+def _exit_with(code):
+    """Service qui s'arrête immédiatement avec le code donné."""
+    sys.exit(code)
+
+
+def _serve_forever():
+    """Service qui ne s'arrête jamais de lui-même."""
+    while True:
+        time.sleep(0.1)
+
+
+class TestSuperviseProcesses:
+    """Tests pour la détection de la sortie d'un service et l'arrêt des autres."""
+
+    def _start(self, *targets):
+        processes = [
+            multiprocessing.Process(target=target, args=args, name=name)
+            for name, target, args in targets
+        ]
+        for process in processes:
+            process.start()
+        return processes
+
+    def test_clean_exit_is_reported_and_siblings_stopped(self):
+        """Vérifie qu'une sortie avec le code 0 est aussi remontée, et que les autres s'arrêtent."""
+        processes = self._start(('server', _serve_forever, ()), ('clean', _exit_with, (0,)))
+        try:
+            stopped = _supervise_processes(processes)
+
+            assert stopped.name == 'clean'
+            assert stopped.exitcode == 0
+        finally:
+            _terminate_processes(processes)
+
+        assert not any(process.is_alive() for process in processes)
+
+    def test_failed_exit_is_reported(self):
+        """Vérifie qu'un service en échec est remonté avec son code de sortie."""
+        processes = self._start(('server', _serve_forever, ()), ('failed', _exit_with, (3,)))
+        try:
+            stopped = _supervise_processes(processes)
+        finally:
+            _terminate_processes(processes)
+
+        assert (stopped.name, stopped.exitcode) == ('failed', 3)
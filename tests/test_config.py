@@ -0,0 +1,34 @@
+"""Tests pour DevToolsConfig - chargement YAML et résolution des chemins."""
+import pytest
+
+from python_pubsub_devtools.config import DevToolsConfig
+
+
+class TestDevToolsConfigFromYaml:
+    """Tests pour le chargement de la configuration depuis un fichier YAML."""
+
+    def test_missing_file_raises_file_not_found(self, tmp_path):
+        """Vérifie qu'un fichier absent lève FileNotFoundError avec le chemin résolu."""
+        missing = tmp_path / "absent.yaml"
+
+        with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+            DevToolsConfig.from_yaml(missing)
+
+    def test_directory_raises_file_not_found(self, tmp_path):
+        """Vérifie qu'un répertoire passé en configuration est signalé comme fichier introuvable."""
+        with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+            DevToolsConfig.from_yaml(tmp_path)
+
+    def test_relative_paths_resolved_against_config_dir(self, tmp_path):
+        """Vérifie que les chemins relatifs sont résolus par rapport au fichier de config."""
+        config_file = tmp_path / "devtools_config.yaml"
+        config_file.write_text(
+            'agents_dir: "./agents"\n'
+            'events_dir: "./events"\n'
+            'recordings_dir: "./recordings"\n'
+        )
+
+        config = DevToolsConfig.from_yaml(config_file)
+
+        assert config.agents_dir == tmp_path / "agents"
+        assert config.event_recorder.recordings_dir == tmp_path / "recordings"
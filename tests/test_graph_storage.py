@@ -0,0 +1,134 @@
+"""Tests pour GraphStorage - cache des graphes Event Flow."""
+import pytest
+
+from python_pubsub_devtools.event_flow.storage import GraphData, GraphStorage
+
+
+class TestGraphStorage:
+    """Tests pour le stockage et la persistance des graphes."""
+
+    def test_store_and_get(self):
+        """Vérifie qu'un graphe stocké peut être relu par son type."""
+        storage = GraphStorage()
+
+        stored = storage.store(GraphData(graph_type="complete", dot_content="digraph G {}"))
+
+        assert stored is True
+        assert storage.get("complete").dot_content == "digraph G {}"
+
+    def test_store_identical_graph_is_noop(self, tmp_path):
+        """Vérifie qu'un graphe identique ne réécrit ni le cache ni le fichier persistant."""
+        persist_path = tmp_path / "cache.json"
+        storage = GraphStorage(persist_path=persist_path)
+        first = GraphData(graph_type="complete", dot_content="digraph G {}", namespaces={"risk"})
+        storage.store(first)
+        mtime_ns = persist_path.stat().st_mtime_ns
+
+        same = GraphData(graph_type="complete", dot_content="digraph G {}", namespaces={"risk"})
+        stored = storage.store(same)
+
+        assert stored is False
+        assert storage.get("complete") is first
+        assert persist_path.stat().st_mtime_ns == mtime_ns
+
+    def test_store_changed_graph_replaces_cached_one(self):
+        """Vérifie qu'un contenu différent remplace le graphe en cache."""
+        storage = GraphStorage()
+        storage.store(GraphData(graph_type="complete", dot_content="digraph G {}"))
+
+        stored = storage.store(GraphData(graph_type="complete", dot_content='digraph G { "A"; }'))
+
+        assert stored is True
+        assert storage.get("complete").dot_content == 'digraph G { "A"; }'
+
+    def test_dot_index_is_parsed_once_and_not_persisted(self):
+        """Vérifie que le DOT pré-analysé est mémorisé sur le graphe sans être sérialisé."""
+        graph = GraphData(
+            graph_type="complete",
+            dot_content=(
+                'digraph G {\n    "a" [class="namespace-risk"];\n'
+                '    "a" -> "b";\n    "a" -> "b";\n}'
+            )
+        )
+
+        assert graph.dot_index is graph.dot_index
+        assert graph.dot_index.node_namespaces == {"a": "risk"}
+        assert list(graph.dot_index.edges) == [("a", "b", "")]
+        assert "dot_index" not in graph.to_dict()
+
+    def test_render_svg_converts_once(self):
+        """Vérifie que le SVG complet n'est rendu qu'une fois et n'est pas sérialisé."""
+        graph = GraphData(graph_type="complete", dot_content="digraph G {}")
+        calls = []
+
+        def convert(dot_content, graph_type):
+            calls.append(graph_type)
+            return b"<svg/>"
+
+        assert graph.render_svg(convert) == b"<svg/>"
+        assert graph.render_svg(convert) == b"<svg/>"
+        assert calls == ["complete"]
+        assert "_rendered_svg" not in graph.to_dict()
+
+    def test_aggregate_follows_stores_and_clears(self):
+        """Vérifie que les totaux affichés sur le tableau de bord suivent les écritures."""
+        storage = GraphStorage()
+        storage.store(GraphData(graph_type="complete", dot_content="a", namespaces={"risk"},
+                                stats={"events": 7}))
+        storage.store(GraphData(graph_type="full-tree", dot_content="b", namespaces={"trading"},
+                                stats={"agents": 3}))
+
+        aggregate = storage.get_aggregate()
+        assert (aggregate["events"], aggregate["agents"], aggregate["connections"]) == (7, 3, 0)
+        assert aggregate["namespaces"] == ("risk", "trading")
+        assert aggregate["total_graphs"] == 2
+
+        storage.clear("complete")
+        assert storage.get_aggregate()["events"] == 0
+        assert storage.get_aggregate()["namespaces"] == ("trading",)
+
+    def test_store_many_counts_each_graph_type_once(self):
+        """Vérifie qu'un graph_type répété dans un lot ne compte qu'une fois (le dernier gagne)."""
+        storage = GraphStorage()
+
+        stored = storage.store_many([
+            GraphData(graph_type="complete", dot_content="a"),
+            GraphData(graph_type="complete", dot_content="b"),
+        ])
+
+        assert stored == 1
+        assert storage.get("complete").dot_content == "b"
+
+    def test_invalid_stats_are_rejected_without_side_effects(self):
+        """Vérifie qu'un graphe aux statistiques invalides est refusé sans bloquer la suite."""
+        storage = GraphStorage()
+        storage.store(GraphData(graph_type="complete", dot_content="a", stats={"events": 7}))
+
+        with pytest.raises(ValueError):
+            storage.store_many([
+                GraphData(graph_type="full-tree", dot_content="b"),
+                GraphData(graph_type="other", dot_content="c", stats={"events": "5"}),
+            ])
+        with pytest.raises(ValueError):
+            storage.store(GraphData(graph_type="other", dot_content="c", stats=["events"]))
+
+        assert storage.get("full-tree") is None
+        assert storage.get_aggregate()["total_graphs"] == 1
+        valid = GraphData(graph_type="full-tree", dot_content="b", stats={"events": 9})
+        assert storage.store(valid) is True
+        assert storage.get_aggregate()["events"] == 9
+
+    def test_persisted_cache_reloads(self, tmp_path):
+        """Vérifie que le cache écrit sur disque est relu à l'identique par un autre stockage."""
+        persist_path = tmp_path / "cache.json"
+        storage = GraphStorage(persist_path=persist_path)
+        storage.store(GraphData(graph_type="complete", dot_content='digraph "é" {}',
+                                namespaces={"risk"}, stats={"events": 2}))
+        storage.store(GraphData(graph_type="full-tree", dot_content="digraph B {}",
+                                svg_content="<svg/>"))
+
+        reloaded = GraphStorage(persist_path=persist_path)
+
+        assert reloaded.get("complete") == storage.get("complete")
+        assert reloaded.get("full-tree") == storage.get("full-tree")
+        assert reloaded.get_aggregate()["events"] == 2
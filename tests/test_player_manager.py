@@ -41,7 +41,7 @@ class TestPlayerManager:
         assert manager.count() == 0
         assert manager.has_players() is False
 
-    @patch('python_pubsub_devtools.event_recorder.player_manager.requests.post')
+    @patch('python_pubsub_devtools.event_recorder.player_manager.requests.Session.post')
     def test_replay_events_posts_to_registered_players(self, mock_post):
         """Vérifie que replay_events poste bien aux players enregistrés via HTTP POST."""
         # Setup
@@ -75,7 +75,7 @@ class TestPlayerManager:
         assert result["replayed_count"] == 4  # 2 events × 2 players
         assert result["failed_count"] == 0
 
-        # Vérifier que requests.post a été appelé 4 fois (2 events × 2 players)
+        # Vérifier que session.post a été appelé 4 fois (2 events × 2 players)
         assert mock_post.call_count == 4
 
         # Vérifier les appels pour le premier événement
@@ -104,7 +104,7 @@ class TestPlayerManager:
         actual_calls = mock_post.call_args_list[:2]
         assert actual_calls == expected_calls
 
-    @patch('python_pubsub_devtools.event_recorder.player_manager.requests.post')
+    @patch('python_pubsub_devtools.event_recorder.player_manager.requests.Session.post')
     def test_replay_events_to_specific_player(self, mock_post):
         """Vérifie qu'on peut cibler un player spécifique."""
         manager = PlayerManager()
@@ -142,7 +142,7 @@ class TestPlayerManager:
             timeout=5
         )
 
-    @patch('python_pubsub_devtools.event_recorder.player_manager.requests.post')
+    @patch('python_pubsub_devtools.event_recorder.player_manager.requests.Session.post')
     def test_replay_handles_http_errors(self, mock_post):
         """Vérifie qu'on gère les erreurs HTTP."""
         import requests
@@ -0,0 +1,44 @@
+"""Tests pour l'écriture atomique des fichiers d'enregistrement."""
+import json
+import os
+import stat
+
+import pytest
+
+from python_pubsub_devtools.event_recorder.recording_manager import write_recording_file
+
+
+class TestWriteRecordingFile:
+    """Tests pour write_recording_file."""
+
+    def test_writes_recording_without_leftover_temp_file(self, tmp_path):
+        """Vérifie que l'enregistrement est écrit et qu'aucun fichier temporaire ne reste."""
+        filepath = tmp_path / 'session.json'
+
+        write_recording_file(filepath, {'events': [1, 2]})
+        write_recording_file(filepath, {'events': [3]})
+
+        assert json.loads(filepath.read_text()) == {'events': [3]}
+        assert [path.name for path in tmp_path.iterdir()] == ['session.json']
+
+    def test_failed_write_removes_temp_file_and_keeps_previous_version(self, tmp_path):
+        """Vérifie qu'un échec de sérialisation ne laisse ni fichier .tmp ni fichier tronqué."""
+        filepath = tmp_path / 'session.json'
+        write_recording_file(filepath, {'events': [1]})
+
+        with pytest.raises(TypeError):
+            write_recording_file(filepath, {'events': [object()]})
+
+        assert json.loads(filepath.read_text()) == {'events': [1]}
+        assert [path.name for path in tmp_path.iterdir()] == ['session.json']
+
+    def test_file_mode_matches_a_plain_open(self, tmp_path):
+        """Vérifie que l'enregistrement a les permissions d'un open() classique, pas 0600."""
+        filepath = tmp_path / 'session.json'
+        reference = tmp_path / 'reference.json'
+        with open(reference, 'w'):
+            pass
+
+        write_recording_file(filepath, {'events': []})
+
+        assert stat.S_IMODE(os.stat(filepath).st_mode) == stat.S_IMODE(os.stat(reference).st_mode)
@@ -0,0 +1,80 @@
+"""Tests pour les résumés d'enregistrements Event Recorder - listage et cache par mtime."""
+import json
+import os
+
+import pytest
+from flask import Flask
+
+from python_pubsub_devtools.event_recorder import views
+from python_pubsub_devtools.event_recorder.views import (
+    get_all_recording_summaries, list_recording_filenames
+)
+
+
+def _write_recording(path, session_name, event_count):
+    """Écrit un enregistrement minimal contenant event_count événements."""
+    events = [
+        {'event_name': f'Event{i}', 'timestamp_offset_ms': i * 1000, 'data': {}}
+        for i in range(event_count)
+    ]
+    path.write_text(json.dumps({
+        'metadata': {'session_name': session_name, 'created_at': '2024-01-01T00:00:00'},
+        'events': events,
+    }))
+
+
+@pytest.fixture
+def recordings_app(tmp_path):
+    """Application Flask minimale pointant sur un répertoire d'enregistrements vierge."""
+    views._summary_cache.clear()
+    app = Flask(__name__)
+    app.config['RECORDINGS_DIR'] = str(tmp_path)
+    with app.app_context():
+        yield tmp_path
+    views._summary_cache.clear()
+
+
+class TestRecordingSummaries:
+    """Tests pour le listage des enregistrements et le cache de leurs résumés."""
+
+    def test_lists_only_json_files(self, tmp_path):
+        """Vérifie que le listage ne garde que les fichiers .json, sans les répertoires."""
+        (tmp_path / 'a.json').write_text('{}')
+        (tmp_path / 'notes.txt').write_text('')
+        (tmp_path / 'dir.json').mkdir()
+
+        assert list_recording_filenames(tmp_path) == ['a.json']
+        assert list_recording_filenames(tmp_path / 'absent') == []
+
+    def test_unchanged_recording_is_served_from_cache(self, recordings_app, monkeypatch):
+        """Vérifie qu'un enregistrement inchangé n'est pas relu, et qu'une modification l'est."""
+        path = recordings_app / 'session.json'
+        _write_recording(path, 'first', 2)
+        loads = []
+        load_recording = views.load_recording
+        monkeypatch.setattr(views, 'load_recording',
+                            lambda name: loads.append(name) or load_recording(name))
+
+        first = get_all_recording_summaries()
+        second = get_all_recording_summaries()
+        _write_recording(path, 'second', 3)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        third = get_all_recording_summaries()
+
+        assert loads == ['session.json', 'session.json']
+        assert first == second
+        assert third[0][0]['session_name'] == 'second'
+        assert third[0][0]['event_count'] == 3
+
+    def test_deleted_recording_leaves_the_cache(self, recordings_app):
+        """Vérifie que le résumé d'un enregistrement supprimé est retiré du cache."""
+        _write_recording(recordings_app / 'kept.json', 'kept', 1)
+        _write_recording(recordings_app / 'deleted.json', 'deleted', 1)
+        get_all_recording_summaries()
+
+        (recordings_app / 'deleted.json').unlink()
+        summaries = get_all_recording_summaries()
+
+        assert [metadata['filename'] for metadata, _ in summaries] == ['kept.json']
+        assert list(views._summary_cache) == [(str(recordings_app), 'kept.json')]
@@ -55,7 +55,7 @@ class TestScenarioBasedMockExchange:
 
         assert len(engine.get_receivers()) == 1
 
-    @patch('python_pubsub_devtools.mock_exchange.scenario_exchange.requests.post')
+    @patch('python_pubsub_devtools.mock_exchange.scenario_exchange.requests.Session.post')
     def test_push_mode_posts_to_registered_receivers(
             self, mock_post, temp_replay_dir, sample_candles_file
     ):
@@ -124,7 +124,7 @@ class TestScenarioBasedMockExchange:
         assert "index" in json_data
         assert json_data["candle"]["open"] == 50000
 
-    @patch('python_pubsub_devtools.mock_exchange.scenario_exchange.requests.post')
+    @patch('python_pubsub_devtools.mock_exchange.scenario_exchange.requests.Session.post')
     def test_push_mode_posts_all_candles_to_all_receivers(
             self, mock_post, temp_replay_dir, sample_candles_file
     ):
@@ -170,7 +170,7 @@ class TestScenarioBasedMockExchange:
         ]
         assert len(bot2_calls) >= 3
 
-    @patch('python_pubsub_devtools.mock_exchange.scenario_exchange.requests.post')
+    @patch('python_pubsub_devtools.mock_exchange.scenario_exchange.requests.Session.post')
     def test_push_mode_handles_receiver_failures(
             self, mock_post, temp_replay_dir, sample_candles_file
     ):
@@ -0,0 +1,544 @@
+"""Tests pour l'API Flask Event Flow - réception et filtrage des graphes."""
+import gzip
+import json
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from python_pubsub_devtools.config import EventFlowConfig
+from python_pubsub_devtools.event_flow.serve_event_flow import (
+    EMPTY_SVG, MAX_FILTERS_PER_BATCH, _convert_dot_to_svg, _filter_dot_content, _filtered_svg_cache,
+    create_app
+)
+from python_pubsub_devtools.event_flow.dot_index import parse_dot
+from python_pubsub_devtools.event_flow.storage import get_storage, reset_storage
+
+# Module dont les dépendances sont remplacées par patch()
+SERVER = 'python_pubsub_devtools.event_flow.serve_event_flow'
+
+# Graphe minimal accepté par /api/graph
+EMPTY_GRAPH = {'graph_type': 'complete', 'dot_content': 'digraph G {}'}
+
+
+@pytest.fixture
+def client():
+    """Client de test Flask avec un stockage de graphes vierge."""
+    reset_storage()
+    _filtered_svg_cache.clear()
+    app = create_app(EventFlowConfig())
+    yield app.test_client()
+    reset_storage()
+
+
+class TestApiStoreGraph:
+    """Tests pour l'endpoint POST /api/graph."""
+
+    def test_store_graph(self, client):
+        """Vérifie qu'un graphe posté en JSON est stocké."""
+        response = client.post('/api/graph', json=EMPTY_GRAPH)
+
+        assert response.status_code == 201
+        assert get_storage().get('complete').dot_content == 'digraph G {}'
+
+    def test_store_gzip_payload(self, client):
+        """Vérifie qu'un corps JSON compressé en gzip est décompressé avant stockage."""
+        body = gzip.compress(json.dumps(EMPTY_GRAPH).encode())
+
+        response = client.post(
+            '/api/graph',
+            data=body,
+            headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'}
+        )
+
+        assert response.status_code == 201
+        assert get_storage().get('complete').dot_content == 'digraph G {}'
+
+    def test_store_raw_dot_body(self, client):
+        """Vérifie qu'un DOT brut est accepté avec ses métadonnées en paramètres de requête."""
+        response = client.post(
+            '/api/graph?graph_type=complete&namespaces=risk,trading&events=3&agents=2',
+            data=b'digraph G {}',
+            headers={'Content-Type': 'text/vnd.graphviz'}
+        )
+
+        assert response.status_code == 201
+        graph = get_storage().get('complete')
+        assert graph.dot_content == 'digraph G {}'
+        assert graph.namespaces == {'risk', 'trading'}
+        assert graph.stats == {'events': 3, 'agents': 2}
+
+    @pytest.mark.parametrize('query', ['events=abc', 'agents=1.5'])
+    def test_store_raw_dot_with_non_integer_stat_returns_400(self, client, query):
+        """Vérifie qu'une statistique non entière en paramètre est rejetée, comme en JSON."""
+        response = client.post(
+            f'/api/graph?graph_type=complete&{query}',
+            data=b'digraph G {}',
+            headers={'Content-Type': 'text/vnd.graphviz'}
+        )
+
+        assert response.status_code == 400
+        assert get_storage().get('complete') is None
+
+    def test_store_non_string_dot_returns_400(self, client):
+        """Vérifie qu'un champ obligatoire de mauvais type est rejeté comme manquant."""
+        response = client.post('/api/graph', json={'graph_type': 'complete', 'dot_content': None})
+
+        assert response.status_code == 400
+        assert get_storage().get('complete') is None
+
+    @pytest.mark.parametrize('fields', [
+        {'stats': {'events': '5'}},
+        {'stats': ['events']},
+        {'stats': {'events': True}},
+        {'namespaces': 'risk'},
+        {'namespaces': [['risk']]},
+    ])
+    def test_store_mistyped_metadata_returns_400(self, client, fields):
+        """Vérifie que des stats ou namespaces mal typés sont rejetés sans bloquer la suite."""
+        response = client.post('/api/graph', json={**EMPTY_GRAPH, **fields})
+
+        assert response.status_code == 400
+        assert get_storage().get('complete') is None
+        response = client.post('/api/graph', json=EMPTY_GRAPH)
+        assert response.status_code == 201
+
+    def test_store_invalid_payload_returns_400(self, client):
+        """Vérifie qu'un corps illisible est rejeté."""
+        response = client.post('/api/graph', data=b'not json', headers={'Content-Encoding': 'gzip'})
+
+        assert response.status_code == 400
+
+    def test_store_gzip_bomb_returns_400(self, client):
+        """Vérifie qu'un corps gzip dépassant la taille décompressée maximale est rejeté."""
+        body = gzip.compress(json.dumps(EMPTY_GRAPH).encode())
+
+        with patch(f'{SERVER}.MAX_DECOMPRESSED_BODY_BYTES', 10):
+            response = client.post(
+                '/api/graph', data=body,
+                headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'}
+            )
+
+        assert response.status_code == 400
+        assert get_storage().get('complete') is None
+
+    def test_store_truncated_gzip_returns_400(self, client):
+        """Vérifie qu'un corps gzip tronqué est rejeté."""
+        body = gzip.compress(json.dumps(EMPTY_GRAPH).encode())[:-8]
+
+        response = client.post(
+            '/api/graph', data=body,
+            headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'}
+        )
+
+        assert response.status_code == 400
+
+
+class TestApiStoreGraphsBulk:
+    """Tests pour l'endpoint POST /api/graph/bulk."""
+
+    def test_store_several_graphs(self, client):
+        """Vérifie que tous les graphes d'une requête groupée sont stockés."""
+        response = client.post('/api/graph/bulk', json={
+            'graphs': [
+                {'graph_type': 'complete', 'dot_content': 'digraph A {}'},
+                {'graph_type': 'full-tree', 'dot_content': 'digraph B {}', 'namespaces': ['risk']},
+            ],
+            'namespaces': ['trading'],
+        })
+
+        assert response.status_code == 201
+        assert response.get_json()['stored'] == 2
+        assert get_storage().get('complete').namespaces == {'trading'}
+        assert get_storage().get('full-tree').namespaces == {'risk'}
+
+    def test_duplicate_graph_type_returns_400(self, client):
+        """Vérifie qu'un lot contenant deux fois le même graph_type est rejeté en entier."""
+        response = client.post('/api/graph/bulk', json={'graphs': [
+            {'graph_type': 'complete', 'dot_content': 'digraph A {}'},
+            {'graph_type': 'complete', 'dot_content': 'digraph B {}'},
+        ]})
+
+        assert response.status_code == 400
+        assert get_storage().get('complete') is None
+
+    def test_resent_graphs_return_200_unchanged(self, client):
+        """Vérifie qu'un lot déjà stocké répond 200 « unchanged », comme /api/graph."""
+        payload = {'graphs': [EMPTY_GRAPH]}
+        client.post('/api/graph/bulk', json=payload)
+
+        response = client.post('/api/graph/bulk', json=payload)
+
+        assert response.status_code == 200
+        assert response.get_json() == {'status': 'unchanged', 'stored': 0, 'unchanged': 1}
+
+    def test_missing_fields_returns_400(self, client):
+        """Vérifie qu'un graphe incomplet fait rejeter toute la requête."""
+        response = client.post('/api/graph/bulk', json={'graphs': [{'graph_type': 'complete'}]})
+
+        assert response.status_code == 400
+        assert get_storage().get('complete') is None
+
+
+class TestConditionalGet:
+    """Tests pour la revalidation par ETag des routes de lecture."""
+
+    def test_dot_route_returns_304_when_unchanged(self, client):
+        """Vérifie qu'un client présentant l'ETag courant reçoit un 304 sans corps."""
+        client.post('/api/graph', json=EMPTY_GRAPH)
+
+        first = client.get('/api/graph/complete')
+        second = client.get('/api/graph/complete', headers={'If-None-Match': first.headers['ETag']})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.data == b''
+
+    @patch(f'{SERVER}._convert_dot_to_svg')
+    def test_svg_route_skips_rendering_when_unchanged(self, mock_convert, client):
+        """Vérifie qu'un SVG déjà connu du client n'est pas reconverti."""
+        client.post('/api/graph', json=EMPTY_GRAPH)
+        etag = get_storage().get('complete').digest
+
+        response = client.get('/graph/complete', headers={'If-None-Match': f'"{etag}"'})
+
+        assert response.status_code == 304
+        mock_convert.assert_not_called()
+
+    def test_dot_route_serves_precompressed_gzip(self, client):
+        """Vérifie que le DOT est servi déjà compressé aux clients qui acceptent gzip."""
+        client.post('/api/graph', json=EMPTY_GRAPH)
+
+        response = client.get('/api/graph/complete', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(response.data) == b'digraph G {}'
+        revalidated = client.get('/api/graph/complete', headers={
+            'Accept-Encoding': 'gzip', 'If-None-Match': response.headers['ETag'],
+        })
+        assert revalidated.status_code == 304
+
+    @patch(f'{SERVER}._convert_dot_to_svg', return_value=b'<svg>full</svg>')
+    def test_svg_route_serves_precompressed_gzip(self, mock_convert, client):
+        """Vérifie que le SVG complet est compressé une fois puis servi tel quel."""
+        client.post('/api/graph', json=EMPTY_GRAPH)
+
+        first = client.get('/graph/complete', headers={'Accept-Encoding': 'gzip'})
+        second = client.get('/graph/complete', headers={'Accept-Encoding': 'gzip'})
+
+        assert first.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(first.data) == b'<svg>full</svg>'
+        assert second.data == first.data
+        assert mock_convert.call_count == 1
+
+
+class TestGraphRoute:
+    """Tests pour la route de secours /graph/<graph_type>."""
+
+    def test_missing_graph_returns_escaped_error_svg(self, client):
+        """Vérifie qu'un graphe inconnu renvoie un SVG d'erreur où le nom demandé est échappé."""
+        response = client.get('/graph/<script>')
+
+        assert response.status_code == 404
+        assert response.mimetype == 'image/svg+xml'
+        assert b"&lt;script&gt;" in response.data
+        assert b"<script>" not in response.data
+
+    def test_slow_render_returns_202_then_shared_result(self, client):
+        """Vérifie qu'un rendu trop long répond 202, puis que la relance récupère le même rendu."""
+        release = threading.Event()
+        calls = []
+
+        def slow_convert(dot_content, graph_type):
+            calls.append(graph_type)
+            release.wait(5)
+            return b'<svg>full</svg>'
+
+        client.post('/api/graph', json=EMPTY_GRAPH)
+        with patch(f'{SERVER}._convert_dot_to_svg', slow_convert), \
+                patch(f'{SERVER}.RENDER_WAIT_SECONDS', 0.05):
+            pending = client.get('/graph/complete')
+            release.set()
+            with patch(f'{SERVER}.RENDER_WAIT_SECONDS', 5):
+                done = client.get('/graph/complete')
+
+        assert pending.status_code == 202
+        assert pending.headers['Retry-After'] == '2'
+        assert done.status_code == 200
+        assert done.data == b'<svg>full</svg>'
+        assert calls == ['complete']
+
+
+class TestIndex:
+    """Tests pour la page d'accueil Event Flow."""
+
+    def test_aggregates_stats_and_namespaces_across_graphs(self, client):
+        """Vérifie que la page affiche le maximum de chaque statistique et tous les namespaces."""
+        client.post('/api/graph/bulk', json={'graphs': [
+            {'graph_type': 'complete', 'dot_content': 'digraph A {}', 'namespaces': ['risk'],
+             'stats': {'events': 7, 'agents': 2}},
+            {'graph_type': 'full-tree', 'dot_content': 'digraph B {}', 'namespaces': ['trading'],
+             'stats': {'events': 3, 'agents': 5}},
+        ]})
+
+        with patch(f'{SERVER}.render_template', return_value='') as mock_render:
+            client.get('/')
+
+        context = mock_render.call_args.kwargs
+        totals = (context['total_events'], context['total_agents'], context['total_connections'])
+        assert totals == (7, 5, 0)
+        assert context['namespaces'] == ['risk', 'trading']
+
+
+class TestStaticFiles:
+    """Tests pour le service des fichiers statiques."""
+
+    def test_wraps_app_with_whitenoise_when_installed(self):
+        """Vérifie que WhiteNoise, s'il est installé, sert /static/ devant Flask."""
+        fake_whitenoise = Mock()
+        reset_storage()
+
+        with patch(f'{SERVER}.WhiteNoise', fake_whitenoise):
+            app = create_app(EventFlowConfig())
+
+        assert app.wsgi_app is fake_whitenoise.return_value
+        kwargs = fake_whitenoise.call_args.kwargs
+        assert kwargs['root'] == app.static_folder
+        assert (kwargs['prefix'], kwargs['max_age']) == ('/static', 60)
+        reset_storage()
+
+
+SAMPLE_DOT = '''digraph EventFlow {
+    rankdir=TB;
+    node [style=filled];
+    "MarketDataReceived" [class="namespace-market_data", shape=ellipse];
+    "PositionOpened" [class="namespace-position", shape=ellipse];
+    "risk_agent" [class="namespace-risk", shape=box];
+    "test_helper" [class="namespace-risk", shape=box];
+    "MarketDataReceived" -> "risk_agent";
+    "MarketDataReceived" -> "risk_agent";
+    "risk_agent" -> "PositionOpened";
+    "MarketDataReceived" -> "test_helper";
+}'''
+
+
+class TestFilterDotContent:
+    """Tests pour le filtrage du DOT par namespaces et mots-clés."""
+
+    def test_keeps_only_selected_namespaces(self):
+        """Vérifie que seuls les nœuds des namespaces cochés et leurs arêtes internes restent."""
+        filtered = _filter_dot_content(parse_dot(SAMPLE_DOT), ['market_data', 'risk'], [])
+
+        assert '"risk_agent" [' in filtered
+        assert '"PositionOpened" [' not in filtered
+        assert '"risk_agent" -> "PositionOpened"' not in filtered
+        assert filtered.rstrip().endswith('}')
+
+    def test_excludes_keyword_matches(self):
+        """Vérifie que les nœuds contenant un mot-clé exclu disparaissent avec leurs arêtes."""
+        filtered = _filter_dot_content(parse_dot(SAMPLE_DOT), ['market_data', 'risk'], ['TEST'])
+
+        assert 'test_helper' not in filtered
+
+    def test_duplicate_edges_emitted_once(self):
+        """Vérifie qu'une arête répétée n'est émise qu'une fois."""
+        filtered = _filter_dot_content(parse_dot(SAMPLE_DOT), ['market_data', 'risk'], [])
+
+        assert filtered.count('"MarketDataReceived" -> "risk_agent"') == 1
+
+    def test_parallel_edges_with_different_labels_are_kept(self):
+        """Vérifie que des arêtes parallèles de libellés différents ne sont pas fusionnées."""
+        dot_content = (
+            'digraph G {\n'
+            '    "A" [class="namespace-a"];\n'
+            '    "B" [class="namespace-a"];\n'
+            '    "A" -> "B" [label="Evt1"];\n'
+            '    "A" -> "B" [label="Evt2"];\n'
+            '    "A" -> "B" [label="Evt1"];\n'
+            '}'
+        )
+
+        filtered = _filter_dot_content(parse_dot(dot_content), ['a'], [])
+
+        assert filtered.count('[label="Evt1"]') == 1
+        assert filtered.count('[label="Evt2"]') == 1
+
+    def test_prunes_to_subgraph_reachable_from_roots(self):
+        """Vérifie que seuls les nœuds atteignables depuis les racines, assez proches, restent."""
+        namespaces = ['market_data', 'position', 'risk']
+
+        one_hop = _filter_dot_content(parse_dot(SAMPLE_DOT), namespaces, [],
+                                      roots=['MarketDataReceived'], max_depth=1)
+        unlimited = _filter_dot_content(parse_dot(SAMPLE_DOT), namespaces, [], roots=['risk_agent'])
+
+        assert '"risk_agent" [' in one_hop
+        assert '"PositionOpened" [' not in one_hop
+        assert '"PositionOpened" [' in unlimited
+        assert '"MarketDataReceived" [' not in unlimited
+
+
+class TestApiFilteredGraph:
+    """Tests pour l'endpoint POST /api/graph/filtered/<graph_type>."""
+
+    @patch(f'{SERVER}._convert_dot_to_svg', return_value=b'<svg/>')
+    def test_repeated_filter_is_served_from_cache(self, mock_convert, client):
+        """Vérifie qu'un filtre n'est converti qu'une fois, et qu'un nouveau DOT vide le cache."""
+        client.post('/api/graph', json={'graph_type': 'complete', 'dot_content': SAMPLE_DOT})
+        filters = {'namespaces': ['risk', 'market_data'], 'keywords': ['test']}
+
+        first = client.post('/api/graph/filtered/complete', json=filters)
+        second = client.post('/api/graph/filtered/complete',
+                             json={'namespaces': ['market_data', 'risk'], 'keywords': ['TEST']})
+        client.post('/api/graph', json={'graph_type': 'complete', 'dot_content': SAMPLE_DOT + '\n'})
+        client.post('/api/graph/filtered/complete', json=filters)
+
+        assert first.data == second.data == b'<svg/>'
+        assert mock_convert.call_count == 2
+
+    @patch(f'{SERVER}._convert_dot_to_svg')
+    def test_unfiltered_request_returns_stored_svg(self, mock_convert, client):
+        """Vérifie que sans filtre effectif le SVG du scanner est renvoyé sans conversion."""
+        client.post('/api/graph', json={
+            'graph_type': 'complete', 'dot_content': SAMPLE_DOT, 'svg_content': '<svg>full</svg>',
+            'namespaces': ['market_data', 'position', 'risk'],
+        })
+
+        response = client.post('/api/graph/filtered/complete',
+                               json={'namespaces': ['market_data', 'position', 'risk']})
+
+        assert response.data == b'<svg>full</svg>'
+        mock_convert.assert_not_called()
+
+    @patch(f'{SERVER}._convert_dot_to_svg', return_value=b'<svg/>')
+    def test_partial_filter_is_not_mistaken_for_full_graph(self, mock_convert, client):
+        """Vérifie que le raccourci « graphe complet » se fonde sur le DOT, pas sur le scanner."""
+        dot_content = (
+            'digraph G {\n'
+            '    "A" [class="namespace-a"];\n'
+            '    "X" [class="namespace-x"];\n'
+            '    "Legend" [shape=note];\n'
+            '}'
+        )
+        client.post('/api/graph', json={
+            'graph_type': 'complete', 'dot_content': dot_content, 'svg_content': '<svg>full</svg>',
+            'namespaces': ['a'],
+        })
+
+        only_a = client.post('/api/graph/filtered/complete', json={'namespaces': ['a']})
+        all_namespaces = client.post('/api/graph/filtered/complete',
+                                     json={'namespaces': ['a', 'x']})
+
+        assert only_a.data == all_namespaces.data == b'<svg/>'
+        filtered_dots = [call.args[0] for call in mock_convert.call_args_list]
+        assert '"X"' not in filtered_dots[0] and '"Legend"' not in filtered_dots[0]
+        assert '"X"' in filtered_dots[1] and '"Legend"' not in filtered_dots[1]
+
+    @patch(f'{SERVER}.subprocess.run')
+    def test_oversized_batch_returns_400(self, mock_run, client):
+        """Vérifie qu'un lot dépassant MAX_FILTERS_PER_BATCH est rejeté sans lancer dot."""
+        client.post('/api/graph', json={'graph_type': 'complete', 'dot_content': SAMPLE_DOT})
+        filters = [{'namespaces': ['risk'], 'keywords': [str(i)]}
+                   for i in range(MAX_FILTERS_PER_BATCH + 1)]
+
+        response = client.post('/api/graph/filtered_batch/complete', json={'filters': filters})
+
+        assert response.status_code == 400
+        mock_run.assert_not_called()
+
+    @pytest.mark.parametrize('filters', [
+        {'namespaces': 'risk'},
+        {'namespaces': [['risk']]},
+        {'namespaces': ['risk'], 'keywords': [1]},
+        {'namespaces': ['risk'], 'roots': [None]},
+        {'namespaces': ['risk'], 'depth': True},
+        {'namespaces': ['risk'], 'depth': -1},
+    ])
+    def test_malformed_filter_returns_400(self, client, filters):
+        """Vérifie qu'un filtre mal typé est rejeté en 400, seul ou dans un lot."""
+        client.post('/api/graph', json={'graph_type': 'complete', 'dot_content': SAMPLE_DOT})
+
+        single = client.post('/api/graph/filtered/complete', json=filters)
+        batch = client.post('/api/graph/filtered_batch/complete', json={'filters': [filters]})
+
+        assert single.status_code == batch.status_code == 400
+
+    @patch(f'{SERVER}._convert_dot_to_svg')
+    def test_disjoint_namespaces_return_empty_svg(self, mock_convert, client):
+        """Vérifie qu'un filtre sans namespace commun avec le graphe ne lance pas Graphviz."""
+        client.post('/api/graph', json={'graph_type': 'complete', 'dot_content': SAMPLE_DOT})
+
+        response = client.post('/api/graph/filtered/complete', json={'namespaces': ['unknown']})
+
+        assert response.status_code == 200
+        assert response.data == EMPTY_SVG
+        mock_convert.assert_not_called()
+
+    @patch(f'{SERVER}.subprocess.run')
+    def test_batch_renders_missing_filters_with_one_dot_call(self, mock_run, client):
+        """Vérifie que les filtres d'un lot sont rendus par un seul appel à dot, dans l'ordre."""
+        mock_run.return_value = Mock(
+            stdout=b'<?xml version="1.0"?>\n<svg>1</svg>\n<?xml version="1.0"?>\n<svg>2</svg>\n')
+        client.post('/api/graph', json={'graph_type': 'complete', 'dot_content': SAMPLE_DOT})
+
+        response = client.post('/api/graph/filtered_batch/complete', json={'filters': [
+            {'namespaces': ['risk']},
+            {'namespaces': ['unknown']},
+            {'namespaces': ['risk', 'market_data'], 'keywords': ['test']},
+        ]})
+
+        svgs = response.get_json()['svgs']
+        assert response.status_code == 200
+        assert mock_run.call_count == 1
+        assert svgs[0].endswith('<svg>1</svg>\n')
+        assert svgs[1] == EMPTY_SVG.decode()
+        assert svgs[2].endswith('<svg>2</svg>\n')
+
+    def test_concurrent_identical_filters_share_one_conversion(self, client):
+        """Vérifie que des requêtes simultanées pour un même filtre ne lancent qu'un seul dot."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_convert(dot_content, graph_type):
+            calls.append(graph_type)
+            started.set()
+            release.wait(5)
+            return b'<svg/>'
+
+        client.post('/api/graph', json={'graph_type': 'complete', 'dot_content': SAMPLE_DOT})
+        app = client.application
+        responses = []
+
+        def request_filter():
+            with app.test_client() as thread_client:
+                responses.append(thread_client.post('/api/graph/filtered/complete',
+                                                    json={'namespaces': ['risk']}))
+
+        with patch(f'{SERVER}._convert_dot_to_svg', slow_convert):
+            threads = [threading.Thread(target=request_filter) for _ in range(3)]
+            threads[0].start()
+            started.wait(5)
+            for thread in threads[1:]:
+                thread.start()
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        assert [response.data for response in responses] == [b'<svg/>'] * 3
+        assert calls == ['complete_filtered']
+
+
+class TestConvertDotToSvg:
+    """Tests pour la conversion DOT -> SVG via Graphviz."""
+
+    @patch(f'{SERVER}.subprocess.run')
+    def test_pipes_dot_through_stdin(self, mock_run):
+        """Vérifie que le DOT passe par stdin et le SVG par stdout, sans fichier temporaire."""
+        mock_run.return_value = Mock(stdout=b'<svg/>')
+
+        svg = _convert_dot_to_svg('digraph G { "é" }', 'complete')
+
+        assert svg == b'<svg/>'
+        args, kwargs = mock_run.call_args
+        assert args[0] == ['dot', '-Tsvg']
+        assert kwargs['input'] == 'digraph G { "é" }'.encode('utf-8')